@@ -1,21 +1,26 @@
 """Application state manager for Race Replay."""
 
-from enum import Enum
-from typing import Callable, Optional
+from enum import IntEnum
+from typing import Callable, Optional, Tuple
 
 
-class AppState(Enum):
+class AppState(IntEnum):
     """Application states."""
-    WAITING_FOR_FILE = "waiting_for_file"
-    PROCESSING = "processing"
-    READY = "ready"
-    ERROR = "error"
-    DEMO = "demo"
+    WAITING_FOR_FILE = 0
+    PROCESSING = 1
+    READY = 2
+    ERROR = 3
+    DEMO = 4
 
 
 class StateManager:
     """Manages application state transitions."""
 
+    __slots__ = (
+        'state', 'input_file_path', 'output_dir', 'error_message',
+        'progress_message', 'progress_percent', '_listeners',
+    )
+
     def __init__(self):
         self.state = AppState.WAITING_FOR_FILE
         self.input_file_path: Optional[str] = None
@@ -24,20 +29,29 @@ class StateManager:
         self.progress_message: str = ""
         self.progress_percent: float = 0.0
 
-        # Callbacks for state changes
-        self._on_state_change: Optional[Callable] = None
+        # Callbacks for state changes (tuple so dispatch can't be disturbed
+        # by a listener adding listeners mid-transition)
+        self._listeners: Tuple[Callable, ...] = ()
 
     def set_state_change_callback(self, callback: Callable):
-        """Set callback to be called when state changes."""
-        self._on_state_change = callback
+        """Set callback to be called when state changes.
+
+        Replaces any listeners added so far; use add_listener to keep them.
+        """
+        self._listeners = (callback,)
+
+    def add_listener(self, callback: Callable):
+        """Add a callback to be called when state changes."""
+        if callback not in self._listeners:
+            self._listeners += (callback,)
 
     def transition_to(self, new_state: AppState):
         """Transition to a new state."""
         old_state = self.state
         self.state = new_state
 
-        if self._on_state_change:
-            self._on_state_change(old_state, new_state)
+        for listener in self._listeners:
+            listener(old_state, new_state)
 
     def set_input_file(self, file_path: str):
         """Set the input file and transition to processing."""
@@ -5,9 +5,29 @@ visualization elements. Users can customize colors through the UI
 and settings persist across sessions.
 """
 
+import atexit
+import functools
 import json
 import os
-from typing import Tuple
+import threading
+import time
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from utils.logging_utils import get_logger
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+logger = get_logger(__name__)
+
+# Sentinel for keys missing from the config
+_MISSING = object()
 
 
 # Type aliases
@@ -15,14 +35,206 @@ RGB = Tuple[int, int, int]
 RGBA = Tuple[int, int, int, int]
 
 
+def _frozen(nested: dict) -> Mapping:
+    """Wrap a nested {category: {key: value}} dict in read-only mappings."""
+    return MappingProxyType({
+        category: MappingProxyType(colors) for category, colors in nested.items()
+    })
+
+
+# Default configuration, built once and shared read-only by all instances
+_DEFAULTS = _frozen({
+    # Car colors (18 cars)
+    'car_colors': {
+        '0': (255, 68, 68),      # Red
+        '1': (68, 255, 68),      # Green
+        '2': (68, 68, 255),      # Blue
+        '3': (255, 255, 68),     # Yellow
+        '4': (255, 68, 255),     # Magenta
+        '5': (68, 255, 255),     # Cyan
+        '6': (255, 136, 68),     # Orange
+        '7': (136, 255, 68),     # Lime
+        '8': (255, 136, 255),    # Pink
+        '9': (136, 68, 255),     # Purple
+        '10': (255, 200, 68),    # Gold
+        '11': (68, 200, 255),    # Sky Blue
+        '12': (200, 68, 255),    # Violet
+        '13': (255, 68, 136),    # Rose
+        '14': (68, 255, 136),    # Mint
+        '15': (136, 136, 255),   # Periwinkle
+        '16': (255, 136, 136),   # Salmon
+        '17': (136, 255, 255),   # Aqua
+    },
+
+    # Brake visualization gradient (front and rear)
+    'brake_gradient': {
+        'front_light': (68, 255, 68),      # Front 0-30% - Green
+        'front_medium': (255, 170, 68),    # Front 30-70% - Orange
+        'front_heavy': (255, 68, 68),      # Front 70-100% - Red
+        'rear_light': (68, 200, 68),       # Rear 0-30% - Darker Green
+        'rear_medium': (255, 140, 68),     # Rear 30-70% - Darker Orange
+        'rear_heavy': (200, 68, 68),       # Rear 70-100% - Darker Red
+    },
+
+    # Deviation bars
+    'deviation_bars': {
+        'right': (255, 20, 147),     # Neon Pink - positive deviation
+        'left': (0, 191, 255),       # Neon Blue - negative deviation
+        'inactive': (60, 60, 60),    # Dim Gray
+    },
+
+    # Acceleration heatmap gradient
+    'acceleration_heatmap': {
+        'low': (50, 90, 255),        # Blue
+        'medium': (60, 220, 60),     # Green
+        'high': (255, 50, 50),       # Red
+    },
+
+    # Delta speed trail gradient (vs reference/ideal)
+    'delta_speed': {
+        'slower': (68, 119, 255),    # Blue - slower than baseline
+        'baseline': (60, 220, 60),   # Green - at baseline speed
+        'faster': (255, 50, 50),     # Red - faster than baseline
+    },
+
+    # Race timer colors
+    'race_timer': {
+        'minutes': (255, 68, 68),    # Red
+        'seconds': (255, 165, 0),    # Orange
+        'milliseconds': (68, 255, 68),  # Green
+        'separator': (150, 150, 150),   # Gray
+    },
+
+    # Track visualization
+    'track': {
+        'density_plot': (255, 255, 255, 128),        # White with alpha
+        'racing_line': (100, 100, 100, 128),         # Gray with alpha
+        'outline': (255, 200, 0, 180),               # Gold with alpha
+        'global_racing_line': (57, 255, 20, 255),    # Neon green
+    },
+
+    # Theme colors - Dark
+    'theme_dark': {
+        'bg': (20, 20, 20),
+        'panel_bg': (40, 40, 40),
+        'panel_bg_alpha': (40, 40, 40, 200),
+        'header_bg': (60, 60, 60, 220),
+        'text': (255, 255, 255),
+        'text_secondary': (200, 200, 200),
+        'text_muted': (150, 150, 150),
+        'accent': (100, 255, 100),
+        'timer_bg': (0, 0, 0, 180),
+    },
+
+    # Theme colors - Light
+    'theme_light': {
+        'bg': (200, 200, 200),
+        'panel_bg': (245, 245, 245),
+        'panel_bg_alpha': (245, 245, 245, 230),
+        'header_bg': (230, 230, 230, 240),
+        'text': (20, 20, 20),
+        'text_secondary': (60, 60, 60),
+        'text_muted': (100, 100, 100),
+        'accent': (0, 180, 0),
+        'timer_bg': (255, 255, 255, 200),
+    },
+
+    # Intro/Loading screen
+    'intro': {
+        'title': (255, 200, 0),         # Gold
+        'subtitle': (150, 150, 150),    # Medium Gray
+        'error': (255, 100, 100),       # Light Red
+        'file_extension': (0, 255, 0),  # Green
+    },
+
+    # HUD elements
+    'hud': {
+        'drag_handle': (150, 150, 150),
+        'collapse_button': (200, 200, 200),
+        'toggle_enabled': (100, 255, 100),
+        'toggle_disabled': (100, 100, 100),
+        'hover_label_bg': (0, 0, 0, 180),
+        'hover_label_text': (255, 255, 255),
+    },
+
+    # Sector timing colors (F1/professional motorsport standard)
+    'sector_timing': {
+        'sector_1': (255, 68, 68),        # Red - Sector 1
+        'sector_2': (68, 136, 255),       # Blue - Sector 2
+        'sector_3': (255, 255, 68),       # Yellow - Sector 3
+        'overall_best': (180, 68, 255),   # Purple - Overall best
+        'personal_best': (68, 255, 68),   # Green - Personal best
+        'slower': (255, 200, 68),         # Orange/Yellow - Slower than best
+        'current': (255, 255, 255),       # White - In progress
+        'delta_positive': (255, 68, 68),  # Red - Behind
+        'delta_negative': (68, 255, 68),  # Green - Ahead
+    },
+
+    # Speed comparison overlay colors
+    'speed_comparison': {
+        'faster': (68, 255, 68),          # Green - Faster than ideal
+        'slower': (255, 68, 68),          # Red - Slower than ideal
+        'neutral': (255, 255, 255),       # White - At ideal speed
+    },
+
+    # Size configuration (stored as single-value tuples for consistency)
+    'sizes': {
+        'car_dot_radius': 8,           # Car marker radius in pixels
+        'brake_arc_thickness': 3,      # Brake arc line thickness
+        'trail_width': 2,              # Acceleration trail width
+        'racing_line_width': 2,        # Racing line thickness
+        'deviation_bar_width': 4,      # Deviation bar width
+        'hud_font_size': 12,           # HUD text font size
+        # Visual effect sizes
+        'brake_arc_max_radius': 120,   # Max brake arc radius in pixels
+        'deviation_bar_length': 20,    # Deviation bar length in pixels
+        'trail_duration_s': 5,         # Trail duration in seconds (1-15)
+        'steering_arrow_size': 30,     # Steering arrow length in pixels
+        'accel_display_size': 15,      # Accel circle max expansion in pixels
+    },
+})
+
+# Value type (tuple color or int size) of every known entry
+_SCHEMA = MappingProxyType({
+    (category, key): tuple if isinstance(value, tuple) else int
+    for category, colors in _DEFAULTS.items()
+    for key, value in colors.items()
+})
+
+
 class ColorConfig:
     """Manages all customizable colors with persistence."""
 
+    __slots__ = (
+        'config_path', '_flat', '_cat_index', '_cache',
+        '_car_color_tuple', '_sector_tuple', '_brake_levels',
+        '_version', '_save_lock',
+    )
+
     # Default config file location
     DEFAULT_CONFIG_PATH = os.path.join(
         os.path.expanduser("~"), ".race_replay_colors.json"
     )
 
+    # Delay before writing changes, so bursts of edits become one save
+    SAVE_DELAY_S = 0.25
+
+    # Keys of the low/mid/high stops for interpolated gradients
+    GRADIENT_STOP_KEYS = {
+        'acceleration_heatmap': ('low', 'medium', 'high'),
+        'delta_speed': ('slower', 'baseline', 'faster'),
+    }
+
+    # Fallbacks for size keys missing from the config
+    SIZE_FALLBACKS = {
+        'car_dot_radius': 8,
+        'brake_arc_thickness': 3,
+        'trail_width': 2,
+        'racing_line_width': 2,
+        'deviation_bar_width': 4,
+        'hud_font_size': 12,
+    }
+
     def __init__(self, config_path: str = None):
         """Initialize with default colors.
 
@@ -30,228 +242,197 @@ class ColorConfig:
             config_path: Path to JSON config file (uses default if None)
         """
         self.config_path = config_path or self.DEFAULT_CONFIG_PATH
-        self._colors = self._get_defaults()
+        # Values are stored flat, keyed by (category, key); the category
+        # index keeps key order for per-category views and for saving
+        self._flat: Dict[Tuple[str, str], object] = {}
+        self._cat_index: Dict[str, List[str]] = {}
+        self._set_all(_DEFAULTS)
+        # Read-only per-category snapshots handed out by the getters
+        self._cache: Dict[str, Mapping] = {}
+        # Dense per-index colors so hot getters skip building string keys
+        self._car_color_tuple: Tuple[RGB, ...] = ()
+        self._sector_tuple: Tuple[RGB, ...] = ()
+        # (light, medium, heavy) brake colors, keyed by front/rear
+        self._brake_levels: Dict[str, Tuple[RGB, RGB, RGB]] = {}
+        # Bumped on every change so consumers can cache derived state
+        self._version = 0
+        # Held while values change and while a save snapshots them
+        self._save_lock = threading.Lock()
+        self._invalidate_all()
         self._load_config()
 
-    def _get_defaults(self) -> dict:
-        """Return default color configuration."""
-        return {
-            # Car colors (18 cars)
-            'car_colors': {
-                '0': (255, 68, 68),      # Red
-                '1': (68, 255, 68),      # Green
-                '2': (68, 68, 255),      # Blue
-                '3': (255, 255, 68),     # Yellow
-                '4': (255, 68, 255),     # Magenta
-                '5': (68, 255, 255),     # Cyan
-                '6': (255, 136, 68),     # Orange
-                '7': (136, 255, 68),     # Lime
-                '8': (255, 136, 255),    # Pink
-                '9': (136, 68, 255),     # Purple
-                '10': (255, 200, 68),    # Gold
-                '11': (68, 200, 255),    # Sky Blue
-                '12': (200, 68, 255),    # Violet
-                '13': (255, 68, 136),    # Rose
-                '14': (68, 255, 136),    # Mint
-                '15': (136, 136, 255),   # Periwinkle
-                '16': (255, 136, 136),   # Salmon
-                '17': (136, 255, 255),   # Aqua
-            },
-
-            # Brake visualization gradient (front and rear)
-            'brake_gradient': {
-                'front_light': (68, 255, 68),      # Front 0-30% - Green
-                'front_medium': (255, 170, 68),    # Front 30-70% - Orange
-                'front_heavy': (255, 68, 68),      # Front 70-100% - Red
-                'rear_light': (68, 200, 68),       # Rear 0-30% - Darker Green
-                'rear_medium': (255, 140, 68),     # Rear 30-70% - Darker Orange
-                'rear_heavy': (200, 68, 68),       # Rear 70-100% - Darker Red
-            },
-
-            # Deviation bars
-            'deviation_bars': {
-                'right': (255, 20, 147),     # Neon Pink - positive deviation
-                'left': (0, 191, 255),       # Neon Blue - negative deviation
-                'inactive': (60, 60, 60),    # Dim Gray
-            },
-
-            # Acceleration heatmap gradient
-            'acceleration_heatmap': {
-                'low': (50, 90, 255),        # Blue
-                'medium': (60, 220, 60),     # Green
-                'high': (255, 50, 50),       # Red
-            },
-
-            # Delta speed trail gradient (vs reference/ideal)
-            'delta_speed': {
-                'slower': (68, 119, 255),    # Blue - slower than baseline
-                'baseline': (60, 220, 60),   # Green - at baseline speed
-                'faster': (255, 50, 50),     # Red - faster than baseline
-            },
-
-            # Race timer colors
-            'race_timer': {
-                'minutes': (255, 68, 68),    # Red
-                'seconds': (255, 165, 0),    # Orange
-                'milliseconds': (68, 255, 68),  # Green
-                'separator': (150, 150, 150),   # Gray
-            },
-
-            # Track visualization
-            'track': {
-                'density_plot': (255, 255, 255, 128),        # White with alpha
-                'racing_line': (100, 100, 100, 128),         # Gray with alpha
-                'outline': (255, 200, 0, 180),               # Gold with alpha
-                'global_racing_line': (57, 255, 20, 255),    # Neon green
-            },
-
-            # Theme colors - Dark
-            'theme_dark': {
-                'bg': (20, 20, 20),
-                'panel_bg': (40, 40, 40),
-                'panel_bg_alpha': (40, 40, 40, 200),
-                'header_bg': (60, 60, 60, 220),
-                'text': (255, 255, 255),
-                'text_secondary': (200, 200, 200),
-                'text_muted': (150, 150, 150),
-                'accent': (100, 255, 100),
-                'timer_bg': (0, 0, 0, 180),
-            },
-
-            # Theme colors - Light
-            'theme_light': {
-                'bg': (200, 200, 200),
-                'panel_bg': (245, 245, 245),
-                'panel_bg_alpha': (245, 245, 245, 230),
-                'header_bg': (230, 230, 230, 240),
-                'text': (20, 20, 20),
-                'text_secondary': (60, 60, 60),
-                'text_muted': (100, 100, 100),
-                'accent': (0, 180, 0),
-                'timer_bg': (255, 255, 255, 200),
-            },
-
-            # Intro/Loading screen
-            'intro': {
-                'title': (255, 200, 0),         # Gold
-                'subtitle': (150, 150, 150),    # Medium Gray
-                'error': (255, 100, 100),       # Light Red
-                'file_extension': (0, 255, 0),  # Green
-            },
-
-            # HUD elements
-            'hud': {
-                'drag_handle': (150, 150, 150),
-                'collapse_button': (200, 200, 200),
-                'toggle_enabled': (100, 255, 100),
-                'toggle_disabled': (100, 100, 100),
-                'hover_label_bg': (0, 0, 0, 180),
-                'hover_label_text': (255, 255, 255),
-            },
-
-            # Sector timing colors (F1/professional motorsport standard)
-            'sector_timing': {
-                'sector_1': (255, 68, 68),        # Red - Sector 1
-                'sector_2': (68, 136, 255),       # Blue - Sector 2
-                'sector_3': (255, 255, 68),       # Yellow - Sector 3
-                'overall_best': (180, 68, 255),   # Purple - Overall best
-                'personal_best': (68, 255, 68),   # Green - Personal best
-                'slower': (255, 200, 68),         # Orange/Yellow - Slower than best
-                'current': (255, 255, 255),       # White - In progress
-                'delta_positive': (255, 68, 68),  # Red - Behind
-                'delta_negative': (68, 255, 68),  # Green - Ahead
-            },
-
-            # Speed comparison overlay colors
-            'speed_comparison': {
-                'faster': (68, 255, 68),          # Green - Faster than ideal
-                'slower': (255, 68, 68),          # Red - Slower than ideal
-                'neutral': (255, 255, 255),       # White - At ideal speed
-            },
-
-            # Size configuration (stored as single-value tuples for consistency)
-            'sizes': {
-                'car_dot_radius': 8,           # Car marker radius in pixels
-                'brake_arc_thickness': 3,      # Brake arc line thickness
-                'trail_width': 2,              # Acceleration trail width
-                'racing_line_width': 2,        # Racing line thickness
-                'deviation_bar_width': 4,      # Deviation bar width
-                'hud_font_size': 12,           # HUD text font size
-                # Visual effect sizes
-                'brake_arc_max_radius': 120,   # Max brake arc radius in pixels
-                'deviation_bar_length': 20,    # Deviation bar length in pixels
-                'trail_duration_s': 5,         # Trail duration in seconds (1-15)
-                'steering_arrow_size': 30,     # Steering arrow length in pixels
-                'accel_display_size': 15,      # Accel circle max expansion in pixels
-            },
-        }
-
     def _load_config(self):
         """Load color configuration from JSON file."""
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    saved = json.load(f)
+                if HAS_ORJSON:
+                    with open(self.config_path, 'rb') as f:
+                        saved = orjson.loads(f.read())
+                else:
+                    with open(self.config_path, 'r') as f:
+                        saved = json.load(f)
 
                 # Merge saved colors with defaults (preserves new defaults)
                 self._merge_colors(saved)
-                print(f"Loaded color config from {self.config_path}")
+                logger.debug("Loaded color config from %s", self.config_path)
             except Exception as e:
-                print(f"Error loading color config: {e}")
+                logger.error("Error loading color config: %s", e, exc_info=True)
+            self._invalidate_all()
+
+    def _set_all(self, nested: Mapping):
+        """Replace all stored values with those of a nested config dict."""
+        self._flat = {
+            (category, key): value
+            for category, colors in nested.items()
+            for key, value in colors.items()
+        }
+        self._cat_index = {category: list(colors) for category, colors in nested.items()}
+
+    def _to_nested(self) -> dict:
+        """Rebuild the nested {category: {key: value}} form used on disk."""
+        flat = self._flat
+        with self._save_lock:
+            return {
+                category: {key: flat[(category, key)] for key in keys}
+                for category, keys in self._cat_index.items()
+            }
+
+    def _rebuild_car_table(self):
+        """Rebuild the per-index car color tuple."""
+        flat = self._flat
+        self._car_color_tuple = tuple(
+            flat.get(('car_colors', str(i)), (255, 255, 255)) for i in range(18)
+        )
+
+    def _rebuild_sector_table(self):
+        """Rebuild the sector color tuple (index 0 is the fallback white)."""
+        flat = self._flat
+        self._sector_tuple = ((255, 255, 255),) + tuple(
+            flat.get(('sector_timing', f'sector_{i}'), (255, 255, 255)) for i in (1, 2, 3)
+        )
+
+    def _rebuild_brake_levels(self):
+        """Rebuild the (light, medium, heavy) brake colors per brake type."""
+        flat = self._flat
+        self._brake_levels = {
+            prefix: tuple(flat[('brake_gradient', f'{prefix}_{level}')]
+                          for level in ('light', 'medium', 'heavy'))
+            for prefix in ('front', 'rear')
+        }
+
+    def _invalidate(self, category: str):
+        """Drop cached views of a category after its values change."""
+        self._version += 1
+        self._cache.pop(category, None)
+        if category == 'car_colors':
+            self._rebuild_car_table()
+        elif category == 'sector_timing':
+            self._rebuild_sector_table()
+        elif category == 'brake_gradient':
+            self._rebuild_brake_levels()
+
+    def _invalidate_all(self):
+        """Drop all cached views after a bulk change (load/reset)."""
+        self._version += 1
+        self._cache.clear()
+        self._rebuild_car_table()
+        self._rebuild_sector_table()
+        self._rebuild_brake_levels()
+
+    @property
+    def version(self) -> int:
+        """Change counter, bumped whenever any color or size changes."""
+        return self._version
 
     def _merge_colors(self, saved: dict):
-        """Merge saved colors into current config."""
-        for category, colors in saved.items():
-            if category in self._colors:
-                if isinstance(colors, dict):
-                    for key, value in colors.items():
-                        if key in self._colors[category]:
-                            # Convert list to tuple
-                            self._colors[category][key] = tuple(value) if isinstance(value, list) else value
+        """Merge saved colors into current config.
+
+        Each saved entry is checked against the schema on its own, so a
+        malformed entry is skipped and keeps its current value.
+        """
+        flat = self._flat
+        empty = {}
+        for entry, kind in _SCHEMA.items():
+            category, key = entry
+            colors = saved.get(category, empty)
+            if not isinstance(colors, dict) or (value := colors.get(key)) is None:
+                continue
+            if kind is tuple:
+                # JSON stores colors as lists
+                if (isinstance(value, (list, tuple)) and len(value) in (3, 4)
+                        and all(isinstance(c, int) and 0 <= c <= 255 for c in value)):
+                    flat[entry] = tuple(value)
+                    continue
+            elif isinstance(value, int):
+                flat[entry] = value
+                continue
+            logger.warning("Ignoring malformed saved value %s/%s: %r", category, key, value)
 
     def save(self):
         """Save current color configuration to JSON file."""
         try:
-            # Convert tuples to lists for JSON serialization
-            serializable = {}
-            for category, colors in self._colors.items():
-                if isinstance(colors, dict):
-                    serializable[category] = {
-                        k: list(v) if isinstance(v, tuple) else v
-                        for k, v in colors.items()
-                    }
-                else:
-                    serializable[category] = colors
-
-            with open(self.config_path, 'w') as f:
-                json.dump(serializable, f, indent=2)
-
-            print(f"Saved color config to {self.config_path}")
+            nested = self._to_nested()
+            if HAS_ORJSON:
+                with open(self.config_path, 'wb') as f:
+                    f.write(orjson.dumps(nested, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.config_path, 'w') as f:
+                    json.dump(nested, f, indent=2)
+
+            logger.debug("Saved color config to %s", self.config_path)
         except Exception as e:
-            print(f"Error saving color config: {e}")
+            logger.error("Error saving color config: %s", e, exc_info=True)
+
+    def _mark_dirty(self):
+        """Schedule a background save of the current configuration."""
+        _schedule_save(self)
 
     def reset_to_defaults(self):
         """Reset all colors to default values."""
-        self._colors = self._get_defaults()
-        self.save()
+        with self._save_lock:
+            self._set_all(_DEFAULTS)
+            self._invalidate_all()
+        self._mark_dirty()
 
     def reset_category(self, category: str):
         """Reset a specific category to defaults."""
-        defaults = self._get_defaults()
-        if category in defaults:
-            self._colors[category] = defaults[category]
-            self.save()
+        if category in _DEFAULTS:
+            defaults = _DEFAULTS[category]
+            with self._save_lock:
+                for key in self._cat_index.get(category, ()):
+                    del self._flat[(category, key)]
+                for key, value in defaults.items():
+                    self._flat[(category, key)] = value
+                self._cat_index[category] = list(defaults)
+                self._invalidate(category)
+            self._mark_dirty()
+
+    def _snap(self, category: str) -> Mapping:
+        """Get a cached read-only snapshot of a category.
+
+        Snapshots are rebuilt lazily after a setter invalidates them, so
+        per-frame getter calls don't allocate a new dict each time.
+        """
+        snap = self._cache.get(category)
+        if snap is None:
+            flat = self._flat
+            snap = MappingProxyType({
+                key: flat[(category, key)] for key in self._cat_index.get(category, ())
+            })
+            self._cache[category] = snap
+        return snap
 
     # ----- Getters -----
 
     def get_car_color(self, index: int) -> RGB:
         """Get car color by index (0-17)."""
-        return self._colors['car_colors'].get(str(index), (255, 255, 255))
+        if 0 <= index < 18:
+            return self._car_color_tuple[index]
+        return self._flat.get(('car_colors', str(index)), (255, 255, 255))
 
     def get_car_colors_list(self) -> list:
         """Get all car colors as a list ordered by index."""
-        return [self._colors['car_colors'].get(str(i), (255, 255, 255))
-                for i in range(18)]
+        return list(self._car_color_tuple)
 
     def get_brake_color(self, intensity: float, brake_type: str = 'front') -> RGB:
         """Get brake color based on intensity (0-1) and type (front/rear).
@@ -260,168 +441,235 @@ class ColorConfig:
             intensity: Brake intensity 0-1
             brake_type: 'front' or 'rear'
         """
-        prefix = brake_type if brake_type in ('front', 'rear') else 'front'
+        levels = self._brake_levels['rear' if brake_type == 'rear' else 'front']
         if intensity < 0.3:
-            return self._colors['brake_gradient'][f'{prefix}_light']
+            return levels[0]
         elif intensity < 0.7:
-            return self._colors['brake_gradient'][f'{prefix}_medium']
+            return levels[1]
         else:
-            return self._colors['brake_gradient'][f'{prefix}_heavy']
+            return levels[2]
 
-    def get_brake_gradient(self) -> dict:
+    def get_brake_gradient(self) -> Mapping[str, RGB]:
         """Get all brake gradient colors."""
-        return self._colors['brake_gradient'].copy()
+        return self._snap('brake_gradient')
 
-    def get_deviation_colors(self) -> dict:
+    def get_deviation_colors(self) -> Mapping[str, RGB]:
         """Get deviation bar colors."""
-        return self._colors['deviation_bars'].copy()
+        return self._snap('deviation_bars')
 
-    def get_acceleration_colors(self) -> dict:
+    def get_acceleration_colors(self) -> Mapping[str, RGB]:
         """Get acceleration heatmap colors."""
-        return self._colors['acceleration_heatmap'].copy()
+        return self._snap('acceleration_heatmap')
 
-    def get_delta_speed_colors(self) -> dict:
+    def get_delta_speed_colors(self) -> Mapping[str, RGB]:
         """Get delta speed trail colors."""
-        return self._colors['delta_speed'].copy()
+        return self._snap('delta_speed')
 
-    def get_race_timer_colors(self) -> dict:
+    def get_race_timer_colors(self) -> Mapping[str, RGB]:
         """Get race timer colors."""
-        return self._colors['race_timer'].copy()
+        return self._snap('race_timer')
 
-    def get_track_colors(self) -> dict:
+    def get_track_colors(self) -> Mapping[str, RGB]:
         """Get track visualization colors."""
-        return self._colors['track'].copy()
+        return self._snap('track')
 
-    def get_theme(self, theme_name: str) -> dict:
+    def get_theme(self, theme_name: str) -> Mapping[str, RGB]:
         """Get theme colors (dark/light)."""
         key = f'theme_{theme_name}'
-        return self._colors.get(key, self._colors['theme_dark']).copy()
+        return self._snap(key if key in self._cat_index else 'theme_dark')
 
-    def get_intro_colors(self) -> dict:
+    def get_intro_colors(self) -> Mapping[str, RGB]:
         """Get intro/loading screen colors."""
-        return self._colors['intro'].copy()
+        return self._snap('intro')
 
-    def get_hud_colors(self) -> dict:
+    def get_hud_colors(self) -> Mapping[str, RGB]:
         """Get HUD element colors."""
-        return self._colors['hud'].copy()
+        return self._snap('hud')
 
-    def get_sector_timing_colors(self) -> dict:
+    def get_sector_timing_colors(self) -> Mapping[str, RGB]:
         """Get sector timing colors."""
-        return self._colors.get('sector_timing', {}).copy()
+        return self._snap('sector_timing')
 
-    def get_speed_comparison_colors(self) -> dict:
+    def get_speed_comparison_colors(self) -> Mapping[str, RGB]:
         """Get speed comparison overlay colors."""
-        return self._colors.get('speed_comparison', {}).copy()
+        return self._snap('speed_comparison')
+
+    def get_gradient_stops(self, category: str) -> np.ndarray:
+        """Get a 3-stop gradient (low, mid, high) as a (3, 3) uint8 array.
+
+        Args:
+            category: 'acceleration_heatmap' or 'delta_speed'
+        """
+        flat = self._flat
+        return np.array([flat[(category, key)] for key in self.GRADIENT_STOP_KEYS[category]],
+                        dtype=np.uint8)
+
+    def get_brake_stops_array(self, brake_type: str = 'front') -> np.ndarray:
+        """Get brake light/medium/heavy colors as a (3, 3) uint8 array."""
+        levels = self._brake_levels['rear' if brake_type == 'rear' else 'front']
+        return np.array(levels, dtype=np.uint8)
 
     def get_sector_color(self, sector: int) -> RGB:
         """Get color for a specific sector (1, 2, or 3)."""
-        colors = self._colors.get('sector_timing', {})
-        return colors.get(f'sector_{sector}', (255, 255, 255))
+        if 0 <= sector <= 3:
+            return self._sector_tuple[sector]
+        return (255, 255, 255)
 
-    def get_sizes(self) -> dict:
-        """Get all size configuration."""
-        return self._colors.get('sizes', {}).copy()
+    def get_sizes(self, keys: Optional[Iterable[str]] = None) -> Mapping[str, int]:
+        """Get size configuration.
+
+        Args:
+            keys: Size keys to fetch in one call (default: all sizes)
+        """
+        if keys is None:
+            return self._snap('sizes')
+        flat = self._flat
+        fallbacks = self.SIZE_FALLBACKS
+        return {key: flat.get(('sizes', key), fallbacks.get(key, 8)) for key in keys}
 
     def get_size(self, key: str) -> int:
         """Get a specific size value."""
-        sizes = self._colors.get('sizes', {})
-        defaults = {
-            'car_dot_radius': 8,
-            'brake_arc_thickness': 3,
-            'trail_width': 2,
-            'racing_line_width': 2,
-            'deviation_bar_width': 4,
-            'hud_font_size': 12,
-        }
-        return sizes.get(key, defaults.get(key, 8))
+        return self._flat.get(('sizes', key), self.SIZE_FALLBACKS.get(key, 8))
 
     # ----- Setters -----
 
+    def _set(self, category: str, key: str, value, create: bool = False) -> bool:
+        """Store a value, invalidating caches and saving only if it changed.
+
+        Args:
+            category: Category name
+            key: Key within the category
+            value: New color tuple or size value
+            create: Add the key if it doesn't exist yet
+
+        Returns:
+            True if the key exists (or was created), False otherwise
+        """
+        entry = (category, key)
+        with self._save_lock:
+            old = self._flat.get(entry, _MISSING)
+            if old is _MISSING:
+                if not create:
+                    return False
+                self._flat[entry] = value
+                self._cat_index.setdefault(category, []).append(key)
+            elif old == value:
+                # Pickers fire repeatedly with the same value; skip the save
+                return True
+            else:
+                self._flat[entry] = value
+            self._invalidate(category)
+        self._mark_dirty()
+        return True
+
     def set_car_color(self, index: int, color: RGB):
         """Set car color by index."""
-        self._colors['car_colors'][str(index)] = tuple(color)
-        self.save()
+        self._set('car_colors', str(index), tuple(color), create=True)
 
     def set_brake_color(self, level: str, color: RGB):
         """Set brake gradient color (light/medium/heavy)."""
-        if level in self._colors['brake_gradient']:
-            self._colors['brake_gradient'][level] = tuple(color)
-            self.save()
+        self.set_color('brake_gradient', level, color)
 
     def set_deviation_color(self, key: str, color: RGB):
         """Set deviation bar color (right/left/inactive)."""
-        if key in self._colors['deviation_bars']:
-            self._colors['deviation_bars'][key] = tuple(color)
-            self.save()
+        self.set_color('deviation_bars', key, color)
 
     def set_acceleration_color(self, level: str, color: RGB):
         """Set acceleration heatmap color (low/medium/high)."""
-        if level in self._colors['acceleration_heatmap']:
-            self._colors['acceleration_heatmap'][level] = tuple(color)
-            self.save()
+        self.set_color('acceleration_heatmap', level, color)
 
     def set_race_timer_color(self, component: str, color: RGB):
         """Set race timer color (minutes/seconds/milliseconds/separator)."""
-        if component in self._colors['race_timer']:
-            self._colors['race_timer'][component] = tuple(color)
-            self.save()
+        self.set_color('race_timer', component, color)
 
     def set_delta_speed_color(self, level: str, color: RGB):
         """Set delta speed trail color (slower/baseline/faster)."""
-        if level in self._colors['delta_speed']:
-            self._colors['delta_speed'][level] = tuple(color)
-            self.save()
+        self.set_color('delta_speed', level, color)
 
     def set_track_color(self, element: str, color):
         """Set track color (racing_line/outline) - accepts RGB or RGBA."""
-        if element in self._colors['track']:
-            self._colors['track'][element] = tuple(color)
-            self.save()
+        self.set_color('track', element, color)
 
     def set_theme_color(self, theme_name: str, key: str, color):
         """Set a specific theme color."""
-        theme_key = f'theme_{theme_name}'
-        if theme_key in self._colors and key in self._colors[theme_key]:
-            self._colors[theme_key][key] = tuple(color)
-            self.save()
+        self.set_color(f'theme_{theme_name}', key, color)
 
     def set_intro_color(self, key: str, color: RGB):
         """Set intro/loading screen color."""
-        if key in self._colors['intro']:
-            self._colors['intro'][key] = tuple(color)
-            self.save()
+        self.set_color('intro', key, color)
 
     def set_hud_color(self, key: str, color):
         """Set HUD element color."""
-        if key in self._colors['hud']:
-            self._colors['hud'][key] = tuple(color)
-            self.save()
+        self.set_color('hud', key, color)
 
     def set_size(self, key: str, value: int):
         """Set a size configuration value."""
-        if 'sizes' not in self._colors:
-            self._colors['sizes'] = {}
-        self._colors['sizes'][key] = value
-        self.save()
+        self._set('sizes', key, value, create=True)
 
     # ----- Utility -----
 
     def get_all_categories(self) -> list:
         """Get list of all color categories."""
-        return list(self._colors.keys())
+        return list(self._cat_index)
 
-    def get_category_colors(self, category: str) -> dict:
+    def get_category_colors(self, category: str) -> Mapping[str, RGB]:
         """Get all colors in a category."""
-        return self._colors.get(category, {}).copy()
+        return self._snap(category)
 
     def set_color(self, category: str, key: str, color):
         """Generic setter for any color."""
-        if category in self._colors and key in self._colors[category]:
-            self._colors[category][key] = tuple(color)
-            self.save()
-            return True
-        return False
-
-
-# Global color config instance
-color_config = ColorConfig()
+        return self._set(category, key, tuple(color))
+
+
+# Configs with unsaved changes. One background thread, started on the
+# first change, writes them at most once per SAVE_DELAY_S.
+_pending_saves = set()
+_pending_lock = threading.Lock()
+_pending_event = threading.Event()
+# Serializes writes between the background thread and the exit hook
+_flush_lock = threading.Lock()
+_save_thread = None
+
+
+def _schedule_save(config: ColorConfig):
+    """Queue a config for the next background save."""
+    global _save_thread
+    with _pending_lock:
+        _pending_saves.add(config)
+        if _save_thread is None:
+            _save_thread = threading.Thread(target=_save_worker, daemon=True)
+            _save_thread.start()
+            atexit.register(_flush_pending)
+    _pending_event.set()
+
+
+def _save_worker():
+    """Write pending configs, batching changes made within SAVE_DELAY_S."""
+    while True:
+        _pending_event.wait()
+        time.sleep(ColorConfig.SAVE_DELAY_S)
+        _flush_pending()
+
+
+def _flush_pending():
+    """Write all configs with unsaved changes now."""
+    with _flush_lock:
+        with _pending_lock:
+            _pending_event.clear()
+            configs = list(_pending_saves)
+            _pending_saves.clear()
+        for config in configs:
+            config.save()
+
+
+@functools.lru_cache(maxsize=None)
+def get_color_config() -> ColorConfig:
+    """Get the shared ColorConfig, loading it from disk on first use."""
+    return ColorConfig()
+
+
+def __getattr__(name):
+    # Keep `color_config` importable without reading the config at import time
+    if name == 'color_config':
+        return get_color_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,14 +5,43 @@ Integrates the color preview display and color picker components.
 """
 
 import dearpygui.dearpygui as dpg
-from .color_config import color_config
+from .color_config import get_color_config
 from .color_preview import ColorPreviewDisplay
 from .color_picker import color_picker
+from utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Shared RGB tuples, so equal colors written to world.colors are one object
+_TUPLE_CACHE = {}
+
+
+def intern_rgb(color):
+    """Return a shared tuple for the given RGB color."""
+    t = tuple(color)
+    return _TUPLE_CACHE.setdefault(t, t)
 
 
 class ColorCustomizationMenu:
     """Main color customization settings panel."""
 
+    # Size sliders per category: (size_key, label, min, max)
+    _SLIDER_CONFIG = {
+        'brake_gradient': (
+            ('brake_arc_max_radius', 'Brake Arc Size', 40, 200),
+        ),
+        'deviation_bars': (
+            ('deviation_bar_length', 'Deviation Bar Length', 10, 50),
+        ),
+        'acceleration_heatmap': (
+            ('accel_display_size', 'Accel Fill Size', 5, 40),
+            ('trail_duration_s', 'Custom Trail Duration (s)', 1, 15),
+        ),
+        'trail': (
+            ('trail_duration_s', 'Trail Duration (s)', 1, 15),
+        ),
+    }
+
     def __init__(self):
         """Initialize the color customization menu."""
         self.window_tag = "color_customization_window"
@@ -26,6 +55,8 @@ class ColorCustomizationMenu:
 
         # Size slider container tag
         self.slider_container_tag = "cc_slider_container"
+        # (slider_tag, size_key) pairs per category, built once per window
+        self._slider_tags_by_cat = {}
 
         # Categories with display names
         self.categories = {
@@ -37,6 +68,8 @@ class ColorCustomizationMenu:
             'race_timer': 'Race Timer',
             'track': 'Track Elements',
         }
+        # Reverse lookup for the category dropdown
+        self._display_to_key = {name: key for key, name in self.categories.items()}
 
     def open(self, world=None, on_colors_changed=None):
         """Open the color customization menu.
@@ -58,6 +91,7 @@ class ColorCustomizationMenu:
         # Delete existing window if present
         if dpg.does_item_exist(self.window_tag):
             dpg.delete_item(self.window_tag)
+        self._slider_tags_by_cat = {}
 
         # Create main window
         with dpg.window(
@@ -100,9 +134,8 @@ class ColorCustomizationMenu:
                 height=420,
                 border=True
             ):
-                # Create preview display
+                # Create preview display (its UI is built on the first render)
                 self.preview_display = ColorPreviewDisplay("cc_preview_container")
-                self.preview_display.create()
                 self.preview_display.set_callback(self._on_color_selected)
                 # Pass car IDs, world colors, and selected cars if available
                 if self.world is not None:
@@ -115,7 +148,7 @@ class ColorCustomizationMenu:
 
             # Slider container for size controls (shown for certain categories)
             with dpg.group(tag=self.slider_container_tag):
-                pass  # Will be populated by _update_sliders
+                pass  # Will be populated by _build_sliders
 
             dpg.add_spacer(height=5)
 
@@ -142,14 +175,7 @@ class ColorCustomizationMenu:
 
     def _on_category_change(self, sender, app_data):
         """Handle category dropdown change."""
-        # Find the category key from display name
-        selected_display_name = app_data
-        category_key = None
-
-        for key, name in self.categories.items():
-            if name == selected_display_name:
-                category_key = key
-                break
+        category_key = self._display_to_key.get(app_data)
 
         if category_key and self.preview_display:
             self.preview_display.set_category(category_key)
@@ -191,8 +217,17 @@ class ColorCustomizationMenu:
             key: Color key
             new_color: New RGB color
         """
+        config = get_color_config()
+
+        # Color already stored: nothing to save, sync or redraw. Car swatches
+        # show world.colors, which can differ from the config, so car colors
+        # are always applied.
+        if (category != 'car_colors'
+                and tuple(new_color) == config.get_category_colors(category).get(key)):
+            return
+
         # Update the color config
-        color_config.set_color(category, key, new_color)
+        config.set_color(category, key, new_color)
 
         # If car color changed, also update world.colors so track rendering uses new color
         if category == 'car_colors' and self.world is not None:
@@ -200,26 +235,26 @@ class ColorCustomizationMenu:
                 car_index = int(key)
                 if car_index < len(self.world.car_ids):
                     car_id = self.world.car_ids[car_index]
-                    self.world.colors[car_id] = tuple(new_color)
-                    print(f"Updated world.colors[{car_id}] = {new_color}")
+                    self.world.colors[car_id] = intern_rgb(new_color)
+                    logger.debug("Updated world.colors[%s] = %s", car_id, new_color)
             except (ValueError, IndexError) as e:
-                print(f"Error updating world color: {e}")
+                logger.warning("Error updating world color: %s", e)
 
-        # Refresh preview
-        if self.preview_display:
+        # Refresh just the edited element; fall back to a full render
+        if self.preview_display and not self.preview_display.render_item(category, key, new_color):
             self.preview_display.render()
 
         # Notify listeners
         if self.on_colors_changed:
             self.on_colors_changed()
 
-        print(f"Updated {category}/{key} to {new_color}")
+        logger.debug("Updated %s/%s to %s", category, key, new_color)
 
     def _on_reset_category(self, sender, app_data):
         """Reset current category to defaults."""
         if self.preview_display:
             category = self.preview_display.current_category
-            color_config.reset_category(category)
+            get_color_config().reset_category(category)
 
             # Sync world.colors if car_colors category was reset
             if category == 'car_colors' and self.world is not None:
@@ -230,11 +265,11 @@ class ColorCustomizationMenu:
             if self.on_colors_changed:
                 self.on_colors_changed()
 
-            print(f"Reset {category} to defaults")
+            logger.debug("Reset %s to defaults", category)
 
     def _on_reset_all(self, sender, app_data):
         """Reset all colors to defaults."""
-        color_config.reset_to_defaults()
+        get_color_config().reset_to_defaults()
 
         # Sync world.colors with reset car colors
         if self.world is not None:
@@ -246,73 +281,66 @@ class ColorCustomizationMenu:
         if self.on_colors_changed:
             self.on_colors_changed()
 
-        print("Reset all colors to defaults")
+        logger.debug("Reset all colors to defaults")
 
     def _sync_world_colors(self):
         """Sync world.colors dictionary with color_config car colors."""
         if self.world is None:
             return
 
-        car_colors = color_config.get_car_colors_list()
-        for i, car_id in enumerate(self.world.car_ids):
-            if i < len(car_colors):
-                self.world.colors[car_id] = car_colors[i]
+        # zip stops at the shorter of the two lists
+        car_colors = get_color_config().get_car_colors_list()
+        self.world.colors.update(zip(self.world.car_ids, car_colors))
+
+    def _build_sliders(self):
+        """Create the size sliders for every category once, all hidden."""
+        for category, sliders in self._SLIDER_CONFIG.items():
+            # Get display name for category
+            category_name = self.categories.get(category, category)
+            slider_tags = []
+
+            with dpg.group(parent=self.slider_container_tag,
+                           tag=f"cc_sliders_{category}", show=False):
+                dpg.add_separator()
+                dpg.add_text(f"{category_name} - Size Settings", color=(255, 200, 0))
+
+                for key, label, min_val, max_val in sliders:
+                    # Keys can appear under several categories, so tag per category
+                    slider_tag = f"size_slider_{category}_{key}"
+                    dpg.add_slider_int(
+                        label=label,
+                        tag=slider_tag,
+                        min_value=min_val,
+                        max_value=max_val,
+                        width=200,
+                        callback=self._on_size_changed,
+                        user_data=key
+                    )
+                    slider_tags.append((slider_tag, key))
+
+            self._slider_tags_by_cat[category] = slider_tags
 
     def _update_sliders(self, category: str):
-        """Update slider container based on selected category."""
-        # Clear existing sliders
-        if dpg.does_item_exist(self.slider_container_tag):
-            dpg.delete_item(self.slider_container_tag, children_only=True)
-
-        # Define sliders for each category with category-specific labels
-        slider_config = {
-            'brake_gradient': [
-                ('brake_arc_max_radius', 'Brake Arc Size', 40, 200),
-            ],
-            'deviation_bars': [
-                ('deviation_bar_length', 'Deviation Bar Length', 10, 50),
-            ],
-            'acceleration_heatmap': [
-                ('accel_display_size', 'Accel Fill Size', 5, 40),
-                ('trail_duration_s', 'Custom Trail Duration (s)', 1, 15),
-            ],
-            'trail': [
-                ('trail_duration_s', 'Trail Duration (s)', 1, 15),
-            ],
-        }
+        """Show the size sliders for the selected category."""
+        if not self._slider_tags_by_cat:
+            self._build_sliders()
 
-        if category not in slider_config:
-            return
+        for cat in self._slider_tags_by_cat:
+            dpg.configure_item(f"cc_sliders_{cat}", show=(cat == category))
 
-        # Get display name for category
-        category_name = self.categories.get(category, category)
+        slider_tags = self._slider_tags_by_cat.get(category)
+        if not slider_tags:
+            return
 
-        # Create sliders for this category
-        with dpg.group(parent=self.slider_container_tag):
-            dpg.add_separator()
-            dpg.add_text(f"{category_name} - Size Settings", color=(255, 200, 0))
-
-            for key, label, min_val, max_val in slider_config[category]:
-                current_value = color_config.get_size(key)
-                slider_tag = f"size_slider_{key}"
-                # Delete existing slider if it exists
-                if dpg.does_item_exist(slider_tag):
-                    dpg.delete_item(slider_tag)
-                dpg.add_slider_int(
-                    label=label,
-                    tag=slider_tag,
-                    default_value=current_value,
-                    min_value=min_val,
-                    max_value=max_val,
-                    width=200,
-                    callback=self._on_size_changed,
-                    user_data=key
-                )
+        # Sync slider values with the config
+        sizes = get_color_config().get_sizes(key for _, key in slider_tags)
+        for slider_tag, key in slider_tags:
+            dpg.set_value(slider_tag, sizes[key])
 
     def _on_size_changed(self, sender, value, user_data):
         """Handle size slider change."""
         key = user_data
-        color_config.set_size(key, value)
+        get_color_config().set_size(key, value)
 
         # Refresh preview to show size change
         if self.preview_display:
@@ -322,14 +350,16 @@ class ColorCustomizationMenu:
         if self.on_colors_changed:
             self.on_colors_changed()
 
-        print(f"Size {key} set to {value}")
+        logger.debug("Size %s set to %s", key, value)
 
     def _on_close(self, sender=None, app_data=None):
         """Close the window."""
         if dpg.does_item_exist(self.window_tag):
             dpg.delete_item(self.window_tag)
+        self._slider_tags_by_cat = {}
 
         if self.preview_display:
+            self.preview_display.destroy()
             self.preview_display = None
 
         self.is_open = False
@@ -0,0 +1,31 @@
+"""Vectorized color gradient helpers for per-segment rendering.
+
+Maps whole arrays of normalized values to RGB colors in one NumPy pass,
+so trail renderers don't interpolate colors segment by segment in Python.
+"""
+
+import numpy as np
+
+
+def interp_gradient_u8(values: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """Interpolate a 3-stop color gradient for an array of values.
+
+    Stops sit at 0.0, 0.5 and 1.0. Values outside 0-1 are clamped.
+
+    Args:
+        values: 1D array of normalized values (0-1)
+        stops: (3, 3) array of RGB stop colors (low, mid, high)
+
+    Returns:
+        (N, 3) uint8 array of RGB colors
+    """
+    v = np.clip(np.asarray(values, dtype=np.float64), 0.0, 1.0)
+    stops = np.asarray(stops, dtype=np.float64)
+
+    # Position within the lower or upper half of the gradient
+    upper = v > 0.5
+    t = np.where(upper, (v - 0.5) * 2.0, v * 2.0)[:, None]
+    start = np.where(upper[:, None], stops[1], stops[0])
+    end = np.where(upper[:, None], stops[2], stops[1])
+
+    return (start + (end - start) * t).astype(np.uint8)
@@ -7,12 +7,15 @@ Provides a popup modal with:
 - Color preview (before/after)
 """
 
+import functools
+import time
+
 import dearpygui.dearpygui as dpg
 from typing import Callable, Tuple
 
 
-# Preset color palette
-COLOR_PALETTE = [
+# Preset color palette (immutable)
+COLOR_PALETTE = (
     # Row 1: Reds
     (255, 0, 0), (255, 68, 68), (255, 100, 100), (255, 136, 136),
     (200, 0, 0), (150, 0, 0), (100, 0, 0), (255, 68, 136),
@@ -36,7 +39,12 @@ COLOR_PALETTE = [
     # Row 6: Grays
     (255, 255, 255), (200, 200, 200), (150, 150, 150), (100, 100, 100),
     (60, 60, 60), (40, 40, 40), (20, 20, 20), (0, 0, 0),
-]
+)
+
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+# Minimum interval between slider-driven UI refreshes (~60 Hz)
+SLIDER_DEBOUNCE_NS = 16_000_000
 
 
 class ColorPicker:
@@ -46,13 +54,19 @@ class ColorPicker:
         """Initialize the color picker."""
         self.window_tag = "color_picker_window"
         self.is_open = False
+        self._ui_ready = False  # True while the picker widgets exist
 
         # Current state
         self.original_color = (255, 255, 255)
-        self.current_color = (255, 255, 255)
+        # Working color, mutated in place while dragging sliders
+        self._rgb_buf = [255, 255, 255]
         self.category = ""
         self.key = ""
 
+        # Slider debounce state
+        self._last_update_ns = 0
+        self._flush_pending = False
+
         # Callbacks
         self.on_apply: Callable = None
         self.on_cancel: Callable = None
@@ -65,6 +79,15 @@ class ColorPicker:
         self.slider_b_tag = "cp_slider_b"
         self.hex_input_tag = "cp_hex_input"
 
+    @property
+    def current_color(self) -> Tuple[int, int, int]:
+        """Current RGB color as a tuple."""
+        return tuple(self._rgb_buf)
+
+    @current_color.setter
+    def current_color(self, color: Tuple[int, int, int]):
+        self._rgb_buf[:] = color[:3]
+
     def open(self, category: str, key: str, color: Tuple[int, int, int],
              on_apply: Callable = None, on_cancel: Callable = None):
         """Open the color picker with the specified color.
@@ -79,11 +102,18 @@ class ColorPicker:
         self.category = category
         self.key = key
         self.original_color = tuple(color[:3])  # Ensure RGB only
-        self.current_color = tuple(color[:3])
+        self.current_color = color
         self.on_apply = on_apply
         self.on_cancel = on_cancel
 
-        self._create_window()
+        # Reuse the window from a previous open; only build it the first time
+        if self._ui_ready and dpg.does_item_exist(self.window_tag):
+            dpg.set_item_label(self.window_tag, f"Colour Picker - {category}/{key}")
+            dpg.configure_item(self.preview_original_tag, fill=self.original_color)
+            self._update_ui()
+            dpg.show_item(self.window_tag)
+        else:
+            self._create_window()
         self.is_open = True
 
     def _create_window(self):
@@ -91,6 +121,7 @@ class ColorPicker:
         # Delete existing window if present
         if dpg.does_item_exist(self.window_tag):
             dpg.delete_item(self.window_tag)
+            self._ui_ready = False
 
         # Create modal window
         with dpg.window(
@@ -132,7 +163,7 @@ class ColorPicker:
                 dpg.add_slider_int(
                     tag=self.slider_r_tag,
                     default_value=self.current_color[0],
-                    min_value=0, max_value=255,
+                    min_value=0, max_value=255, clamped=True,
                     width=300,
                     callback=self._on_slider_change
                 )
@@ -142,7 +173,7 @@ class ColorPicker:
                 dpg.add_slider_int(
                     tag=self.slider_g_tag,
                     default_value=self.current_color[1],
-                    min_value=0, max_value=255,
+                    min_value=0, max_value=255, clamped=True,
                     width=300,
                     callback=self._on_slider_change
                 )
@@ -152,7 +183,7 @@ class ColorPicker:
                 dpg.add_slider_int(
                     tag=self.slider_b_tag,
                     default_value=self.current_color[2],
-                    min_value=0, max_value=255,
+                    min_value=0, max_value=255, clamped=True,
                     width=300,
                     callback=self._on_slider_change
                 )
@@ -190,17 +221,41 @@ class ColorPicker:
                     callback=self._on_reset
                 )
 
+        self._ui_ready = True
+
     def _set_color(self, color: Tuple[int, int, int]):
         """Set the current color and update UI."""
-        self.current_color = tuple(color)
+        self.current_color = color
         self._update_ui()
 
-    def _on_slider_change(self, sender, app_data):
-        """Handle RGB slider changes."""
-        r = dpg.get_value(self.slider_r_tag)
-        g = dpg.get_value(self.slider_g_tag)
-        b = dpg.get_value(self.slider_b_tag)
-        self.current_color = (r, g, b)
+    # Hot callbacks below bind dpg functions as keyword-only defaults so they
+    # are local lookups; keyword-only keeps dpg from passing user_data into them.
+
+    def _on_slider_change(self, sender, app_data, *, _now=time.perf_counter_ns,
+                          _frame=dpg.get_frame_count, _at_frame=dpg.set_frame_callback):
+        """Handle RGB slider changes.
+
+        Refreshes are rate-limited while dragging; a trailing frame callback
+        picks up the final slider value.
+        """
+        now = _now()
+        if now - self._last_update_ns < SLIDER_DEBOUNCE_NS:
+            if not self._flush_pending:
+                self._flush_pending = True
+                _at_frame(_frame() + 2, self._flush_color)
+            return
+        self._last_update_ns = now
+        self._flush_color()
+
+    def _flush_color(self, sender=None, app_data=None, *, _get=dpg.get_value):
+        """Read the RGB sliders into the current color and refresh the UI."""
+        self._flush_pending = False
+        if not self._ui_ready:
+            return
+        buf = self._rgb_buf
+        buf[0] = _get(self.slider_r_tag)
+        buf[1] = _get(self.slider_g_tag)
+        buf[2] = _get(self.slider_b_tag)
         self._update_preview()
         self._update_hex()
 
@@ -215,64 +270,59 @@ class ColorPicker:
 
     def _update_ui(self):
         """Update all UI elements to reflect current color."""
-        self._update_preview()
-        self._update_sliders()
-        self._update_hex()
+        # One lock for all updates; preview last so the frame is coherent
+        with dpg.mutex():
+            self._update_sliders()
+            self._update_hex()
+            self._update_preview()
 
-    def _update_preview(self):
+    def _update_preview(self, *, _cfg=dpg.configure_item):
         """Update the preview rectangle."""
-        if dpg.does_item_exist(self.preview_current_tag):
-            dpg.configure_item(
+        if self._ui_ready:
+            _cfg(
                 self.preview_current_tag,
-                fill=self.current_color
+                fill=self._rgb_buf
             )
 
-    def _update_sliders(self):
+    def _update_sliders(self, *, _set=dpg.set_value):
         """Update RGB sliders."""
-        if dpg.does_item_exist(self.slider_r_tag):
-            dpg.set_value(self.slider_r_tag, self.current_color[0])
-            dpg.set_value(self.slider_g_tag, self.current_color[1])
-            dpg.set_value(self.slider_b_tag, self.current_color[2])
+        if self._ui_ready:
+            buf = self._rgb_buf
+            _set(self.slider_r_tag, buf[0])
+            _set(self.slider_g_tag, buf[1])
+            _set(self.slider_b_tag, buf[2])
 
-    def _update_hex(self):
+    def _update_hex(self, *, _set=dpg.set_value):
         """Update hex input field."""
-        if dpg.does_item_exist(self.hex_input_tag):
-            dpg.set_value(
+        if self._ui_ready:
+            _set(
                 self.hex_input_tag,
                 self._color_to_hex(self.current_color)
             )
 
-    def _color_to_hex(self, color: Tuple[int, int, int]) -> str:
-        """Convert RGB tuple to hex string."""
-        return f"#{color[0]:02x}{color[1]:02x}{color[2]:02x}"
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _color_to_hex(color: Tuple[int, int, int]) -> str:
+        """Convert RGB tuple to hex string (memoized), clamping to 0-255."""
+        return "#" + bytes(min(255, max(0, c)) for c in color[:3]).hex()
 
     def _hex_to_color(self, hex_str: str) -> Tuple[int, int, int]:
         """Convert hex string to RGB tuple."""
         hex_str = hex_str.lstrip('#')
-        if len(hex_str) == 6:
-            try:
-                return (
-                    int(hex_str[0:2], 16),
-                    int(hex_str[2:4], 16),
-                    int(hex_str[4:6], 16)
-                )
-            except ValueError:
-                pass
-        elif len(hex_str) == 3:
-            try:
-                return (
-                    int(hex_str[0] * 2, 16),
-                    int(hex_str[1] * 2, 16),
-                    int(hex_str[2] * 2, 16)
-                )
-            except ValueError:
-                pass
-        return None
+        if len(hex_str) == 3:
+            hex_str = ''.join(c * 2 for c in hex_str)
+        # int() would also accept prefixes/underscores, so check digits first
+        if len(hex_str) != 6 or not _HEX_DIGITS.issuperset(hex_str):
+            return None
+        v = int(hex_str, 16)
+        return ((v >> 16) & 0xff, (v >> 8) & 0xff, v & 0xff)
 
     def _on_apply(self, sender, app_data):
         """Handle Apply button click."""
+        if self._flush_pending:
+            self._flush_color()
         if self.on_apply:
-            self.on_apply(self.category, self.key, self.current_color)
+            self.on_apply(self.category, self.key, tuple(self._rgb_buf))
         self.close()
 
     def _on_cancel(self, sender, app_data):
@@ -287,9 +337,9 @@ class ColorPicker:
         self._update_ui()
 
     def close(self):
-        """Close the color picker window."""
+        """Close the color picker window (hidden and kept for the next open)."""
         if dpg.does_item_exist(self.window_tag):
-            dpg.delete_item(self.window_tag)
+            dpg.hide_item(self.window_tag)
         self.is_open = False
 
 
@@ -6,8 +6,68 @@ Users can click on different colored sections to customize them.
 
 import math
 import dearpygui.dearpygui as dpg
-from .color_config import color_config
+import numpy as np
+from .color_config import get_color_config
 from .color_picker import color_picker
+from utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Draw functions and their positional argument names, for pooled items
+_DRAW_FUNCS = {
+    'circle': dpg.draw_circle,
+    'rectangle': dpg.draw_rectangle,
+    'text': dpg.draw_text,
+    'polyline': dpg.draw_polyline,
+    'polygon': dpg.draw_polygon,
+}
+# Cell size (px) of the grid used to hit-test clickable regions
+_HIT_CELL = 32
+
+# Brake arc levels: (color key, intensity, radius as a fraction of the arc scale)
+_BRAKE_FRONT_LEVELS = (
+    ('front_light', 0.15, 0.5),
+    ('front_medium', 0.5, 0.75),
+    ('front_heavy', 0.85, 1.0),
+)
+_BRAKE_REAR_LEVELS = (
+    ('rear_light', 0.15, 0.5),
+    ('rear_medium', 0.5, 0.75),
+    ('rear_heavy', 0.85, 1.0),
+)
+
+# Deviation bar alphas, increasing with distance from the car
+_DEVIATION_ALPHAS = tuple(int(255 * (i + 1) / 5) for i in range(5))
+
+# Unit circle as 24 segments (first point repeated to close the outline)
+_UNIT_CIRCLE_24 = tuple(
+    (math.cos(2 * math.pi * i / 24), math.sin(2 * math.pi * i / 24)) for i in range(25)
+)
+
+# Car grid layouts: (max cars, cols, rows), first match wins
+_GRID_LAYOUTS = (
+    (6, 3, 2),
+    (12, 4, 3),
+    (math.inf, 6, 3),
+)
+
+# Config category read by each preview category, where the names differ
+_CONFIG_CATEGORY = {'trail': 'delta_speed'}
+
+# Size settings each preview category reads
+_CATEGORY_SIZES = {
+    'brake_gradient': ('brake_arc_max_radius',),
+    'deviation_bars': ('deviation_bar_length',),
+    'acceleration_heatmap': ('trail_duration_s', 'accel_display_size'),
+}
+
+_DRAW_ARG_NAMES = {
+    'circle': ('center', 'radius'),
+    'rectangle': ('pmin', 'pmax'),
+    'text': ('pos', 'text'),
+    'polyline': ('points',),
+    'polygon': ('points',),
+}
 
 
 class ColorPreviewDisplay:
@@ -22,6 +82,7 @@ class ColorPreviewDisplay:
         self.parent = parent_window
         self.drawlist_tag = "color_preview_drawlist"
         self.window_tag = "color_preview_window"
+        self.handler_tag = "color_preview_click_handlers"
 
         # Preview state
         self.current_category = "car_colors"
@@ -30,9 +91,49 @@ class ColorPreviewDisplay:
 
         # Element bounding boxes for click detection
         self.clickable_regions = {}
+        # Region ids per grid cell they overlap, in drawing order
+        self._hit_grid = {}
 
-        # Car IDs for display (set by menu)
-        self.car_ids = []
+        # Drawn items showing each (category, key) color, for render_item
+        self._color_items = {}
+
+        # True between create() and destroy(). UI elements are created on
+        # the first render, and clicks are ignored while this is False.
+        self._created = False
+
+        # Inputs of the last render, to skip redrawing an unchanged preview
+        self._render_sig = None
+
+        # Arc polylines, keyed by (cx, cy, radius, start_deg, end_deg); cleared
+        # when the config changes so old radii don't pile up
+        self._arc_point_cache = {}
+
+        # Car grid geometry (see _car_grid), keyed by car count
+        self._car_grid_key = None
+        self._car_grid_lists = None
+        self._car_cx = self._car_cy = self._car_bounds = None
+
+        # Car dot polygons, keyed by (cx, cy, radius)
+        self._dot_points_cache = {}
+
+        # Deviation bar rectangles, keyed by the configured bar length
+        self._deviation_geom_key = None
+        self._deviation_geom_cache = []
+
+        # Colors/sizes for the current category, keyed by (category, config version)
+        self._cfg = {}
+        self._cfg_key = None
+
+        # Persistent draw items: one draw node per category, and pools of
+        # items per (category, kind) that renders reconfigure in order
+        self._nodes = {}
+        self._pools = {}
+        self._pool_used = {}
+
+        # Car IDs for display (set by menu); the setter also builds labels
+        self._car_ids = []
+        self._car_labels = []
+        self._car_label_offsets = []
 
         # World colors for displaying actual track colours (set by menu)
         self.world_colors = {}
@@ -46,8 +147,23 @@ class ColorPreviewDisplay:
         self.center_x = self.preview_width // 2
         self.center_y = self.preview_height // 2
 
+    @property
+    def car_ids(self):
+        """Car IDs shown in the car colors grid."""
+        return self._car_ids
+
+    @car_ids.setter
+    def car_ids(self, car_ids):
+        self._car_ids = car_ids
+        # Grid labels (last 6 chars like "040-3") and their centering offsets
+        self._car_labels = [car_id[-6:] for car_id in car_ids]
+        self._car_label_offsets = [len(label) * 3 for label in self._car_labels]
+
     def create(self):
-        """Create the preview display UI elements."""
+        """Create the preview display UI elements (no-op if already created)."""
+        if self._created:
+            return
+        self._render_sig = None
         # Create a child window for the preview
         with dpg.child_window(
             tag=self.window_tag,
@@ -63,11 +179,22 @@ class ColorPreviewDisplay:
                 height=self.preview_height
             )
 
-        # Register click handler with unique tag
-        handler_tag = f"{self.window_tag}_handler"
-        if not dpg.does_item_exist(handler_tag):
-            with dpg.handler_registry(tag=handler_tag):
-                dpg.add_mouse_click_handler(callback=self._handle_click)
+        # Background, shared by all categories
+        dpg.draw_rectangle(
+            [0, 0], [self.preview_width, self.preview_height],
+            fill=(30, 30, 30), parent=self.drawlist_tag
+        )
+        self._nodes.clear()
+        self._pools.clear()
+
+        # Click handler bound to the drawlist itself, so DPG only calls it
+        # for clicks on the preview rather than every click in the app
+        if dpg.does_item_exist(self.handler_tag):
+            dpg.delete_item(self.handler_tag)
+        with dpg.item_handler_registry(tag=self.handler_tag):
+            dpg.add_item_clicked_handler(callback=self._handle_click)
+        dpg.bind_item_handler_registry(self.drawlist_tag, self.handler_tag)
+        self._created = True
 
     def set_category(self, category: str):
         """Set the visualization category to display.
@@ -87,34 +214,153 @@ class ColorPreviewDisplay:
         self.on_color_select_callback = callback
 
     def render(self):
-        """Render the preview based on current category."""
-        # Clear previous drawings
-        dpg.delete_item(self.drawlist_tag, children_only=True)
-        self.clickable_regions.clear()
+        """Render the preview based on current category.
 
-        # Draw background
-        dpg.draw_rectangle(
-            [0, 0], [self.preview_width, self.preview_height],
-            fill=(30, 30, 30), parent=self.drawlist_tag
+        Does nothing if the category, selection, colors and config are the
+        same as in the last render. Creates the UI elements on first use.
+        """
+        if not self._created:
+            self.create()
+
+        sig = (
+            self.current_category,
+            self.selected_element,
+            get_color_config().version,
+            tuple(self.car_ids),
+            tuple(sorted(self.selected_car_ids)),
+            tuple(sorted(self.world_colors.items())),
         )
+        if sig == self._render_sig:
+            return
+        self._render_sig = sig
+
+        # Rebuild as one batch under the DPG lock, so the render thread never
+        # draws a half-rebuilt preview between our calls
+        with dpg.mutex():
+            # Show only this category's node; its pooled items get reused
+            node = self._category_node(self.current_category)
+            for other in self._nodes.values():
+                if other != node:
+                    dpg.configure_item(other, show=False)
+            dpg.configure_item(node, show=True)
+
+            self.clickable_regions.clear()
+            self._color_items.clear()
+            self._pool_used = {}
+
+            # Render based on category
+            if self.current_category == "car_colors":
+                self._render_car_colors()
+            elif self.current_category == "brake_gradient":
+                self._render_brake_gradient()
+            elif self.current_category == "deviation_bars":
+                self._render_deviation_bars()
+            elif self.current_category == "acceleration_heatmap":
+                self._render_acceleration_heatmap()
+            elif self.current_category == "race_timer":
+                self._render_race_timer()
+            elif self.current_category == "track":
+                self._render_track()
+            elif self.current_category == "trail":
+                self._render_trail()
+            else:
+                self._render_generic()
+
+            # Hide pooled items this render didn't use
+            for (category, kind), pool in self._pools.items():
+                if category == self.current_category:
+                    for item in pool[self._pool_used.get(kind, 0):]:
+                        dpg.configure_item(item, show=False)
+
+        self._build_hit_grid()
 
-        # Render based on category
-        if self.current_category == "car_colors":
-            self._render_car_colors()
-        elif self.current_category == "brake_gradient":
-            self._render_brake_gradient()
-        elif self.current_category == "deviation_bars":
-            self._render_deviation_bars()
-        elif self.current_category == "acceleration_heatmap":
-            self._render_acceleration_heatmap()
-        elif self.current_category == "race_timer":
-            self._render_race_timer()
-        elif self.current_category == "track":
-            self._render_track()
-        elif self.current_category == "trail":
-            self._render_trail()
+    def _build_hit_grid(self):
+        """Index clickable regions by the grid cells their bounds overlap."""
+        grid = {}
+        for region_id, region in self.clickable_regions.items():
+            x1, y1, x2, y2 = region['bounds']
+            for cx in range(int(x1 // _HIT_CELL), int(x2 // _HIT_CELL) + 1):
+                for cy in range(int(y1 // _HIT_CELL), int(y2 // _HIT_CELL) + 1):
+                    grid.setdefault((cx, cy), []).append(region_id)
+        self._hit_grid = grid
+
+    def _config(self) -> dict:
+        """Colors and sizes for the current category, re-read only after changes."""
+        config = get_color_config()
+        key = (self.current_category, config.version)
+        if key != self._cfg_key:
+            category = self.current_category
+            if category == 'car_colors':
+                colors = config.get_car_colors_list()
+            else:
+                colors = config.get_category_colors(_CONFIG_CATEGORY.get(category, category))
+            self._arc_point_cache.clear()
+            self._cfg = {
+                'colors': colors,
+                'sizes': config.get_sizes(_CATEGORY_SIZES.get(category, ())),
+            }
+            self._cfg_key = key
+        return self._cfg
+
+    def _category_node(self, category: str):
+        """Get (or create) the draw node holding a category's items."""
+        node = self._nodes.get(category)
+        if node is None:
+            node = dpg.add_draw_node(parent=self.drawlist_tag)
+            self._nodes[category] = node
+        return node
+
+    def _draw(self, kind: str, *args, **kwargs):
+        """Draw a primitive, reusing a pooled item of this category if one is free.
+
+        Args:
+            kind: 'circle', 'rectangle', 'text', 'polyline' or 'polygon'
+            *args: Positional arguments of the matching dpg.draw_* call
+            **kwargs: Keyword arguments of the matching dpg.draw_* call
+
+        Returns:
+            The draw item
+        """
+        kwargs.update(zip(_DRAW_ARG_NAMES[kind], args))
+        pool = self._pools.setdefault((self.current_category, kind), [])
+        index = self._pool_used.get(kind, 0)
+        self._pool_used[kind] = index + 1
+
+        if index < len(pool):
+            item = pool[index]
+            dpg.configure_item(item, show=True, **kwargs)
         else:
-            self._render_generic()
+            item = _DRAW_FUNCS[kind](parent=self._nodes[self.current_category], **kwargs)
+            pool.append(item)
+        return item
+
+    def render_item(self, category: str, key: str, color) -> bool:
+        """Recolor the drawn items for one color without a full re-render.
+
+        Args:
+            category: Color category
+            key: Color key within category
+            color: New RGB color
+
+        Returns:
+            False if nothing on screen shows this color (caller should render())
+        """
+        items = self._color_items.get((category, key))
+        if not items:
+            return False
+
+        rgb = tuple(color[:3])
+        for item, attr, alpha in items:
+            dpg.configure_item(item, **{attr: rgb if alpha is None else (*rgb, alpha)})
+
+        for region in self.clickable_regions.values():
+            if region['category'] == category and region['key'] == key:
+                region['color'] = rgb
+        return True
+
+    def _bind(self, item, category: str, key: str, attr: str = 'fill', alpha: int = None):
+        """Remember a drawn item whose `attr` shows the color for category/key."""
+        self._color_items.setdefault((category, key), []).append((item, attr, alpha))
 
     def _render_car_colors(self):
         """Render car color preview - grid of car dots with IDs."""
@@ -125,33 +371,20 @@ class ColorPreviewDisplay:
             for car_id in self.car_ids:
                 colors.append(self.world_colors.get(car_id, (255, 255, 255)))
         else:
-            colors = color_config.get_car_colors_list()
+            colors = self._config()['colors']
 
         # Determine number of cars to display
         num_cars = len(self.car_ids) if self.car_ids else min(len(colors), 18)
 
-        # Grid layout - dynamic based on number of cars
-        if num_cars <= 6:
-            cols, rows = 3, 2
-        elif num_cars <= 12:
-            cols, rows = 4, 3
-        else:
-            cols, rows = 6, 3
-
-        cell_w = self.preview_width // cols
-        cell_h = self.preview_height // rows
-        radius = min(cell_w, cell_h) // 4
+        centers_x, centers_y, radius, bounds = self._car_grid(num_cars)
 
         for i in range(num_cars):
             if i >= len(colors):
                 break
 
             color = colors[i]
-            row = i // cols
-            col = i % cols
-
-            cx = col * cell_w + cell_w // 2
-            cy = row * cell_h + cell_h // 2
+            cx = centers_x[i]
+            cy = centers_y[i]
 
             # Check if this car is selected on the track
             is_selected = False
@@ -161,76 +394,113 @@ class ColorPreviewDisplay:
 
             # Draw white ring around selected cars
             if is_selected:
-                dpg.draw_circle(
-                    [cx, cy], radius + 4, fill=(0, 0, 0, 0), color=(255, 255, 255),
-                    thickness=3, parent=self.drawlist_tag
+                self._draw(
+                    'circle', [cx, cy], radius + 4, fill=(0, 0, 0, 0), color=(255, 255, 255),
+                    thickness=3
                 )
 
-            # Draw car dot
-            dpg.draw_circle(
-                [cx, cy], radius, fill=color, color=(255, 255, 255),
-                thickness=2 if self.selected_element == f"car_{i}" else 1,
-                parent=self.drawlist_tag
+            # Draw car dot as a prebuilt polygon rather than a circle DPG
+            # re-tessellates
+            dot = self._draw(
+                'polygon', self._dot_points(cx, cy, radius), fill=color, color=(255, 255, 255),
+                thickness=2 if self.selected_element == f"car_{i}" else 1
             )
+            self._bind(dot, 'car_colors', str(i))
 
             # Draw car ID (last 6 chars) or number if no IDs available
-            if self.car_ids and i < len(self.car_ids):
-                car_label = self.car_ids[i][-6:]  # Last 6 chars like "040-3"
+            if i < len(self._car_labels):
+                car_label = self._car_labels[i]
+                label_offset = self._car_label_offsets[i]
             else:
                 car_label = str(i + 1)
+                label_offset = len(car_label) * 3
 
             # Center the text below the circle
-            text_x = cx - len(car_label) * 3
+            text_x = cx - label_offset
             text_y = cy + radius + 3
-            dpg.draw_text(
-                [text_x, text_y], car_label,
-                color=(200, 200, 200), size=9, parent=self.drawlist_tag
+            self._draw(
+                'text', [text_x, text_y], car_label,
+                color=(200, 200, 200), size=9
             )
 
             # Store clickable region
             self.clickable_regions[f"car_{i}"] = {
-                'bounds': (cx - radius, cy - radius, cx + radius, cy + radius + 15),
+                'bounds': bounds[i],
                 'category': 'car_colors',
                 'key': str(i),
                 'color': color
             }
 
+    def _car_grid(self, num_cars: int):
+        """Car grid geometry, recomputed only when the car count changes.
+
+        The arrays stay on self as _car_cx, _car_cy and _car_bounds (N, 4).
+
+        Returns:
+            (center x list, center y list, dot radius, bounds tuple list)
+        """
+        if self._car_grid_key == num_cars:
+            return self._car_grid_lists
+
+        # Grid layout - dynamic based on number of cars
+        cols, rows = next((c, r) for limit, c, r in _GRID_LAYOUTS if num_cars <= limit)
+        cell_w = self.preview_width // cols
+        cell_h = self.preview_height // rows
+        radius = min(cell_w, cell_h) // 4
+
+        index = np.arange(num_cars)
+        cx = (index % cols) * cell_w + cell_w // 2
+        cy = (index // cols) * cell_h + cell_h // 2
+        # Clickable bounds include the label below the dot
+        bounds = np.stack([cx - radius, cy - radius, cx + radius, cy + radius + 15], axis=1)
+
+        self._car_cx, self._car_cy, self._car_bounds = cx, cy, bounds
+        self._car_grid_key = num_cars
+        self._car_grid_lists = (cx.tolist(), cy.tolist(), radius,
+                                [tuple(b) for b in bounds.tolist()])
+        return self._car_grid_lists
+
+    def _dot_points(self, cx, cy, radius) -> list:
+        """Polygon points for a car dot, cached by position and radius."""
+        key = (cx, cy, radius)
+        points = self._dot_points_cache.get(key)
+        if points is None:
+            points = [[cx + radius * ux, cy + radius * uy] for ux, uy in _UNIT_CIRCLE_24]
+            self._dot_points_cache[key] = points
+        return points
+
     def _render_brake_gradient(self):
         """Render brake visualization preview with front and rear arcs."""
-        colors = color_config.get_brake_gradient()
+        cfg = self._config()
+        colors = cfg['colors']
 
         # Get max arc radius from config and scale for preview
-        max_radius = color_config.get_size('brake_arc_max_radius')
+        max_radius = cfg['sizes']['brake_arc_max_radius']
         # Scale to fit in preview (max_radius 200 -> 120 in preview)
         scale = min(120, max_radius * 0.6)
 
         # Draw central car dot
         car_radius = 25
-        dpg.draw_circle(
-            [self.center_x, self.center_y], car_radius,
-            fill=(200, 200, 200), parent=self.drawlist_tag
+        self._draw(
+            'circle', [self.center_x, self.center_y], car_radius,
+            fill=(200, 200, 200)
         )
 
         # Draw front brake arcs (top half) at different intensities
-        front_levels = [
-            ('front_light', 0.15, int(scale * 0.5)),
-            ('front_medium', 0.5, int(scale * 0.75)),
-            ('front_heavy', 0.85, int(scale))
-        ]
-
-        for level, intensity, radius in front_levels:
+        for level, intensity, fraction in _BRAKE_FRONT_LEVELS:
             color = colors[level]
+            radius = int(scale * fraction)
 
             # Draw arc (top arc for front brakes)
             start_angle = 30
             end_angle = 150
-            self._draw_arc(
+            arc = self._draw_arc(
                 self.center_x, self.center_y, radius,
                 start_angle, end_angle, color, 6
             )
+            self._bind(arc, 'brake_gradient', level, 'color')
 
             # Clickable region
-            label_name = level.replace('front_', '')
             self.clickable_regions[f"brake_{level}"] = {
                 'bounds': (self.center_x - radius - 10, self.center_y - radius - 20,
                           self.center_x + radius + 10, self.center_y - 20),
@@ -240,22 +510,18 @@ class ColorPreviewDisplay:
             }
 
         # Draw rear brake arcs (bottom half) at different intensities
-        rear_levels = [
-            ('rear_light', 0.15, int(scale * 0.5)),
-            ('rear_medium', 0.5, int(scale * 0.75)),
-            ('rear_heavy', 0.85, int(scale))
-        ]
-
-        for level, intensity, radius in rear_levels:
+        for level, intensity, fraction in _BRAKE_REAR_LEVELS:
             color = colors[level]
+            radius = int(scale * fraction)
 
             # Draw arc (bottom arc for rear brakes)
             start_angle = 210
             end_angle = 330
-            self._draw_arc(
+            arc = self._draw_arc(
                 self.center_x, self.center_y, radius,
                 start_angle, end_angle, color, 6
             )
+            self._bind(arc, 'brake_gradient', level, 'color')
 
             # Clickable region
             self.clickable_regions[f"brake_{level}"] = {
@@ -267,87 +533,59 @@ class ColorPreviewDisplay:
             }
 
         # Labels for front and rear
-        dpg.draw_text(
-            [self.center_x - 25, 20],
+        self._draw(
+            'text', [self.center_x - 25, 20],
             "Front Brakes",
-            color=(200, 200, 200), size=11, parent=self.drawlist_tag
+            color=(200, 200, 200), size=11
         )
-        dpg.draw_text(
-            [self.center_x - 25, self.preview_height - 35],
+        self._draw(
+            'text', [self.center_x - 25, self.preview_height - 35],
             "Rear Brakes",
-            color=(200, 200, 200), size=11, parent=self.drawlist_tag
+            color=(200, 200, 200), size=11
         )
 
         # Intensity labels on the side
-        dpg.draw_text(
-            [10, self.center_y - 60], "Light",
-            color=(150, 150, 150), size=9, parent=self.drawlist_tag
+        self._draw(
+            'text', [10, self.center_y - 60], "Light",
+            color=(150, 150, 150), size=9
         )
-        dpg.draw_text(
-            [10, self.center_y - 10], "Medium",
-            color=(150, 150, 150), size=9, parent=self.drawlist_tag
+        self._draw(
+            'text', [10, self.center_y - 10], "Medium",
+            color=(150, 150, 150), size=9
         )
-        dpg.draw_text(
-            [10, self.center_y + 40], "Heavy",
-            color=(150, 150, 150), size=9, parent=self.drawlist_tag
+        self._draw(
+            'text', [10, self.center_y + 40], "Heavy",
+            color=(150, 150, 150), size=9
         )
 
     def _render_deviation_bars(self):
         """Render deviation bars preview."""
-        colors = color_config.get_deviation_colors()
+        cfg = self._config()
+        colors = cfg['colors']
 
         # Get bar length from config
-        config_bar_length = color_config.get_size('deviation_bar_length')
+        config_bar_length = cfg['sizes']['deviation_bar_length']
 
         # Draw central car
         car_radius = 25
-        dpg.draw_circle(
-            [self.center_x, self.center_y], car_radius,
-            fill=(200, 200, 200), parent=self.drawlist_tag
+        self._draw(
+            'circle', [self.center_x, self.center_y], car_radius,
+            fill=(200, 200, 200)
         )
 
-        # Draw left deviation bars - scale to preview
-        bar_length = int(config_bar_length * 1.5)  # Scale up for visibility
-        bar_width = 6
-        base_offset = 50
-        spacing = max(10, bar_length // 2)
-
-        for i in range(5):
-            x = self.center_x - base_offset - i * spacing
-            y1 = self.center_y - bar_length // 2
-            y2 = self.center_y + bar_length // 2
-
-            # Fill increases with distance
-            fill = (i + 1) / 5
-            color = colors['left']
-            alpha_color = (*color, int(255 * fill))
-
-            dpg.draw_rectangle(
-                [x - bar_width // 2, y1], [x + bar_width // 2, y2],
-                fill=alpha_color, parent=self.drawlist_tag
-            )
-
-        # Draw right deviation bars
-        for i in range(5):
-            x = self.center_x + base_offset + i * spacing
-            y1 = self.center_y - bar_length // 2
-            y2 = self.center_y + bar_length // 2
-
-            fill = (i + 1) / 5
-            color = colors['right']
-            alpha_color = (*color, int(255 * fill))
-
-            dpg.draw_rectangle(
-                [x - bar_width // 2, y1], [x + bar_width // 2, y2],
-                fill=alpha_color, parent=self.drawlist_tag
-            )
+        # Draw left and right deviation bars from the cached geometry
+        for side, pmin, pmax, alpha in self._deviation_geom(config_bar_length):
+            color = colors[side]
+            bar = self._draw('rectangle', pmin, pmax, fill=(color[0], color[1], color[2], alpha))
+            self._bind(bar, 'deviation_bars', side, alpha=alpha)
 
         # Labels and clickable regions
-        dpg.draw_text(
-            [self.center_x - 150, self.center_y + 50],
+        label = self._draw(
+            'text', [self.center_x - 150, self.center_y + 50],
             "Left (negative)",
-            color=colors['left'], size=12, parent=self.drawlist_tag
+            color=colors['left'], size=12
         )
+        self._bind(label, 'deviation_bars', 'left', 'color')
         self.clickable_regions['deviation_left'] = {
             'bounds': (self.center_x - 200, self.center_y - 50,
                       self.center_x - 40, self.center_y + 50),
@@ -356,11 +594,12 @@ class ColorPreviewDisplay:
             'color': colors['left']
         }
 
-        dpg.draw_text(
-            [self.center_x + 70, self.center_y + 50],
+        label = self._draw(
+            'text', [self.center_x + 70, self.center_y + 50],
             "Right (positive)",
-            color=colors['right'], size=12, parent=self.drawlist_tag
+            color=colors['right'], size=12
         )
+        self._bind(label, 'deviation_bars', 'right', 'color')
         self.clickable_regions['deviation_right'] = {
             'bounds': (self.center_x + 40, self.center_y - 50,
                       self.center_x + 200, self.center_y + 50),
@@ -369,13 +608,41 @@ class ColorPreviewDisplay:
             'color': colors['right']
         }
 
+    def _deviation_geom(self, config_bar_length: int) -> list:
+        """Bar rectangles for the deviation preview, rebuilt when the length changes.
+
+        Returns:
+            List of (side, pmin, pmax, alpha) for the 5 left and 5 right bars
+        """
+        if self._deviation_geom_key == config_bar_length:
+            return self._deviation_geom_cache
+
+        # Scale to preview
+        bar_length = int(config_bar_length * 1.5)  # Scale up for visibility
+        bar_width = 6
+        base_offset = 50
+        spacing = max(10, bar_length // 2)
+        y1 = self.center_y - bar_length // 2
+        y2 = self.center_y + bar_length // 2
+
+        geom = []
+        for side, direction in (('left', -1), ('right', 1)):
+            for i, alpha in enumerate(_DEVIATION_ALPHAS):
+                x = self.center_x + direction * (base_offset + i * spacing)
+                geom.append((side, [x - bar_width // 2, y1], [x + bar_width // 2, y2], alpha))
+
+        self._deviation_geom_key = config_bar_length
+        self._deviation_geom_cache = geom
+        return geom
+
     def _render_acceleration_heatmap(self):
         """Render acceleration trail preview."""
-        colors = color_config.get_acceleration_colors()
+        cfg = self._config()
+        colors = cfg['colors']
 
         # Get size settings from config
-        trail_duration = color_config.get_size('trail_duration_s')
-        accel_size = color_config.get_size('accel_display_size')
+        trail_duration = cfg['sizes']['trail_duration_s']
+        accel_size = cfg['sizes']['accel_display_size']
 
         # Scale trail length based on duration (1-15s maps to 100-350px)
         trail_length = int(100 + (trail_duration - 1) * 17.8)
@@ -392,17 +659,19 @@ class ColorPreviewDisplay:
             x = start_x + i * segment_width
             color = colors[level]
 
-            dpg.draw_rectangle(
-                [x, start_y], [x + segment_width, start_y + trail_height],
-                fill=color, parent=self.drawlist_tag
+            segment = self._draw(
+                'rectangle', [x, start_y], [x + segment_width, start_y + trail_height],
+                fill=color
             )
+            self._bind(segment, 'acceleration_heatmap', level)
 
             # Label
-            dpg.draw_text(
-                [x + 10, start_y + trail_height + 10],
+            label = self._draw(
+                'text', [x + 10, start_y + trail_height + 10],
                 level.capitalize(),
-                color=color, size=12, parent=self.drawlist_tag
+                color=color, size=12
             )
+            self._bind(label, 'acceleration_heatmap', level, 'color')
 
             # Clickable region
             self.clickable_regions[f'accel_{level}'] = {
@@ -414,14 +683,14 @@ class ColorPreviewDisplay:
 
         # Draw car at end of trail
         car_x = start_x + trail_length + 30
-        dpg.draw_circle(
-            [car_x, self.center_y], 20,
-            fill=(200, 200, 200), parent=self.drawlist_tag
+        self._draw(
+            'circle', [car_x, self.center_y], 20,
+            fill=(200, 200, 200)
         )
 
     def _render_race_timer(self):
         """Render race timer preview."""
-        colors = color_config.get_race_timer_colors()
+        colors = self._config()['colors']
 
         # Draw timer: 12:34:567
         y = self.center_y
@@ -442,10 +711,11 @@ class ColorPreviewDisplay:
             else:
                 color = colors[key]
 
-            dpg.draw_text(
-                [x, y - 20], text,
-                color=color, size=32, parent=self.drawlist_tag
+            digits = self._draw(
+                'text', [x, y - 20], text,
+                color=color, size=32
             )
+            self._bind(digits, 'race_timer', key, 'color')
 
             if key != 'separator':
                 # Clickable region
@@ -460,7 +730,7 @@ class ColorPreviewDisplay:
 
     def _render_track(self):
         """Render track element preview with dynamic list from track displays."""
-        colors = color_config.get_track_colors()
+        colors = self._config()['colors']
 
         # Track elements matching the Track Displays menu
         track_elements = [
@@ -490,22 +760,22 @@ class ColorPreviewDisplay:
             rgb = color[:3] if len(color) >= 3 else color
 
             # Draw colour box with border
-            dpg.draw_rectangle(
-                [box_x, y], [box_x + box_size, y + box_size],
-                fill=rgb, color=(255, 255, 255), thickness=1,
-                parent=self.drawlist_tag
+            box = self._draw(
+                'rectangle', [box_x, y], [box_x + box_size, y + box_size],
+                fill=rgb, color=(255, 255, 255), thickness=1
             )
+            self._bind(box, 'track', key)
 
             # Draw label
-            dpg.draw_text(
-                [label_x, y + 12], display_name,
-                color=(200, 200, 200), size=14, parent=self.drawlist_tag
+            self._draw(
+                'text', [label_x, y + 12], display_name,
+                color=(200, 200, 200), size=14
             )
 
             # Draw "Click to change" hint
-            dpg.draw_text(
-                [label_x, y + 32], "Click to change",
-                color=(100, 100, 100), size=10, parent=self.drawlist_tag
+            self._draw(
+                'text', [label_x, y + 32], "Click to change",
+                color=(100, 100, 100), size=10
             )
 
             # Store clickable region (the colour box)
@@ -518,7 +788,7 @@ class ColorPreviewDisplay:
 
     def _render_trail(self):
         """Render trail color preview - wavy line with 3 segments."""
-        colors = color_config.get_delta_speed_colors()
+        colors = self._config()['colors']
 
         # Define 3 segments: slower (blue), baseline (green), faster (red)
         segments = [
@@ -552,23 +822,24 @@ class ColorPreviewDisplay:
                 points.append([x, y])
 
             # Draw polyline for this segment
-            dpg.draw_polyline(
-                points, color=color, thickness=6,
-                parent=self.drawlist_tag
+            line = self._draw(
+                'polyline', points, color=color, thickness=6
             )
+            self._bind(line, 'delta_speed', key, 'color')
 
             # Draw label below the segment
             label_x = start_x + segment_width / 2 - 20
             label_y = start_y + wave_amplitude + 20
-            dpg.draw_text(
-                [label_x, label_y], label,
-                color=color, size=14, parent=self.drawlist_tag
+            text = self._draw(
+                'text', [label_x, label_y], label,
+                color=color, size=14
             )
+            self._bind(text, 'delta_speed', key, 'color')
 
             # Draw "Click to change" hint
-            dpg.draw_text(
-                [label_x, label_y + 20], "Click to change",
-                color=(100, 100, 100), size=10, parent=self.drawlist_tag
+            self._draw(
+                'text', [label_x, label_y + 20], "Click to change",
+                color=(100, 100, 100), size=10
             )
 
             # Store clickable region (the segment area)
@@ -582,22 +853,23 @@ class ColorPreviewDisplay:
 
     def _render_generic(self):
         """Render generic category preview."""
-        category_colors = color_config.get_category_colors(self.current_category)
+        category_colors = self._config()['colors']
 
         y = 30
         for key, color in category_colors.items():
             rgb = color[:3] if len(color) > 3 else color
 
             # Color swatch
-            dpg.draw_rectangle(
-                [30, y], [60, y + 20],
-                fill=rgb, parent=self.drawlist_tag
+            swatch = self._draw(
+                'rectangle', [30, y], [60, y + 20],
+                fill=rgb
             )
+            self._bind(swatch, self.current_category, key)
 
             # Label
-            dpg.draw_text(
-                [70, y + 2], key,
-                color=(200, 200, 200), size=11, parent=self.drawlist_tag
+            self._draw(
+                'text', [70, y + 2], key,
+                color=(200, 200, 200), size=11
             )
 
             # Clickable region
@@ -611,38 +883,40 @@ class ColorPreviewDisplay:
             y += 30
 
     def _draw_arc(self, cx, cy, radius, start_deg, end_deg, color, thickness):
-        """Draw an arc using line segments."""
+        """Draw an arc using line segments and return the polyline item."""
+        key = (cx, cy, radius, start_deg, end_deg)
+        points = self._arc_point_cache.get(key)
+        if points is None:
+            points = self._arc_points(cx, cy, radius, start_deg, end_deg)
+            self._arc_point_cache[key] = points
+        return self._draw('polyline', points, color=color, thickness=thickness)
+
+    @staticmethod
+    def _arc_points(cx, cy, radius, start_deg, end_deg) -> list:
+        """Compute the 21 points of a 20-segment arc."""
         segments = 20
-        angle_range = end_deg - start_deg
-        points = []
-
-        for i in range(segments + 1):
-            angle = math.radians(start_deg + (angle_range * i / segments))
-            x = cx + radius * math.cos(angle)
-            y = cy - radius * math.sin(angle)  # Negative because screen Y is inverted
-            points.append([x, y])
-
-        dpg.draw_polyline(
-            points, color=color, thickness=thickness,
-            parent=self.drawlist_tag
-        )
+        start = math.radians(start_deg)
+        step = math.radians(end_deg - start_deg) / segments
+
+        # Chebyshev recurrence: p[i+1] = 2*cos(step)*p[i] - p[i-1], so only
+        # the first two points need trig calls
+        alpha = 2.0 * math.cos(step)
+        x0, y0 = radius * math.cos(start), radius * math.sin(start)
+        x1, y1 = radius * math.cos(start + step), radius * math.sin(start + step)
+        points = [[cx + x0, cy - y0], [cx + x1, cy - y1]]  # Screen Y is inverted
+        for _ in range(segments - 1):
+            x0, x1 = x1, alpha * x1 - x0
+            y0, y1 = y1, alpha * y1 - y0
+            points.append([cx + x1, cy - y1])
+        return points
 
     def _handle_click(self, sender, app_data):
         """Handle mouse clicks on the preview."""
-        # Don't process clicks if color picker is already open
-        if color_picker.is_open:
-            return
-
-        # Check if click is within our drawlist
-        if not dpg.does_item_exist(self.drawlist_tag):
-            return
-
-        # Check if the parent window exists and is shown
-        if not dpg.does_item_exist(self.window_tag):
+        if not self._created:
             return
 
-        # Check if the main customization menu is open
-        if not dpg.does_item_exist("color_customization_window"):
+        # Don't process clicks if color picker is already open
+        if color_picker.is_open:
             return
 
         # Get mouse position in screen coordinates
@@ -663,12 +937,14 @@ class ColorPreviewDisplay:
         if not (0 <= rel_x <= self.preview_width and 0 <= rel_y <= self.preview_height):
             return
 
-        # Check clickable regions
-        for region_id, region in self.clickable_regions.items():
+        # Check only the regions overlapping the clicked grid cell
+        cell = (int(rel_x // _HIT_CELL), int(rel_y // _HIT_CELL))
+        for region_id in self._hit_grid.get(cell, ()):
+            region = self.clickable_regions[region_id]
             x1, y1, x2, y2 = region['bounds']
             if x1 <= rel_x <= x2 and y1 <= rel_y <= y2:
                 self.selected_element = region_id
-                print(f"Color preview clicked: {region['category']}/{region['key']}")
+                logger.debug("Color preview clicked: %s/%s", region['category'], region['key'])
 
                 if self.on_color_select_callback:
                     self.on_color_select_callback(
@@ -677,7 +953,7 @@ class ColorPreviewDisplay:
                         region['color']
                     )
                 else:
-                    print("Warning: No color select callback set!")
+                    logger.warning("No color select callback set")
 
                 # Re-render to show selection
                 self.render()
@@ -685,5 +961,13 @@ class ColorPreviewDisplay:
 
     def destroy(self):
         """Clean up UI elements."""
+        self._created = False
+        # The handler calls back into this instance; drop it so the next
+        # preview registers its own
+        if dpg.does_item_exist(self.handler_tag):
+            dpg.delete_item(self.handler_tag)
+        self._render_sig = None
+        self._nodes.clear()
+        self._pools.clear()
         if dpg.does_item_exist(self.window_tag):
             dpg.delete_item(self.window_tag)
@@ -3,6 +3,9 @@
 import time
 import dearpygui.dearpygui as dpg
 
+# Shortest real-time step update_simulation applies (coalesces sub-frame calls)
+MIN_UPDATE_INTERVAL_S = 1 / 240
+
 
 class PlaybackControls:
     """Manages playback state and UI controls."""
@@ -11,9 +14,14 @@ class PlaybackControls:
         self.world = world_model
         self.is_playing = False
         self.speed_factor = 1.0
-        self.last_frame_time = time.time()
+        self.last_frame_time = time.perf_counter()
         self.screenshot_callback = screenshot_callback
         self.video_exporter = video_exporter
+        # Mirrors video_exporter.is_recording; kept in sync by _toggle_recording
+        self._recording = False
+        # Last values written to the UI, to skip redundant set_value calls
+        self._last_scrubber_s = -1
+        self._last_recording_status = None
 
     def setup_ui(self):
         """Create control widgets."""
@@ -52,8 +60,12 @@ class PlaybackControls:
     def update_simulation(self):
         """Called each frame to update simulation time."""
         if self.is_playing:
-            current_time = time.time()
+            current_time = time.perf_counter()
             dt_real = current_time - self.last_frame_time
+            # Coalesce calls closer together than a frame; last_frame_time is
+            # left alone so the skipped time is applied by the next call
+            if dt_real < MIN_UPDATE_INTERVAL_S:
+                return
             self.last_frame_time = current_time
 
             # Update simulation time
@@ -65,13 +77,16 @@ class PlaybackControls:
                 self.world.current_time_ms = self.world.total_duration_ms
                 self.is_playing = False
 
-            # Update scrubber
-            dpg.set_value("time_scrubber", int(self.world.current_time_ms // 1000))
+            # Update scrubber (whole seconds, so only when the second changes)
+            cur_s = int(self.world.current_time_ms // 1000)
+            if cur_s != self._last_scrubber_s:
+                self._last_scrubber_s = cur_s
+                dpg.set_value("time_scrubber", cur_s)
 
     def play(self):
         """Start playback."""
         self.is_playing = True
-        self.last_frame_time = time.time()
+        self.last_frame_time = time.perf_counter()
 
     def pause(self):
         """Pause playback."""
@@ -81,6 +96,7 @@ class PlaybackControls:
         """Restart from beginning."""
         self.world.current_time_ms = 0
         self.is_playing = False
+        self._last_scrubber_s = 0
         dpg.set_value("time_scrubber", 0)
 
     def set_speed(self, sender, speed):
@@ -90,6 +106,7 @@ class PlaybackControls:
     def scrub_time(self, sender, time_s):
         """Scrub to specific time."""
         self.world.current_time_ms = time_s * 1000
+        self._last_scrubber_s = time_s
 
     def _take_screenshot(self, sender=None, app_data=None):
         """Handle screenshot button click."""
@@ -105,12 +122,15 @@ class PlaybackControls:
             # Start recording
             success = self.video_exporter.start_recording()
             if success:
+                self._recording = True
+                self._last_recording_status = None
                 dpg.set_item_label("video_record_button", "Stop Recording")
                 dpg.set_value("recording_status_text", "Recording...")
                 dpg.configure_item("recording_status_text", color=(255, 100, 100))
         else:
             # Stop recording
             output_path = self.video_exporter.stop_recording()
+            self._recording = False
             dpg.set_item_label("video_record_button", "Start Recording")
             if output_path:
                 import os
@@ -123,16 +143,22 @@ class PlaybackControls:
 
     def update_recording_status(self):
         """Update recording status display."""
-        if not self.video_exporter or not self.video_exporter.is_recording:
+        if not self._recording:
             return
 
         status = self.video_exporter.get_recording_status()
         frame_count = status['frame_count']
         duration = status['duration']
 
+        # Text shows frames and tenths of a second; skip if neither changed
+        key = (frame_count, int(duration * 10))
+        if key == self._last_recording_status:
+            return
+        self._last_recording_status = key
+
         dpg.set_value("recording_status_text", f"Recording: {frame_count} frames ({duration:.1f}s)")
 
     def capture_video_frame(self):
         """Capture frame if recording."""
-        if self.video_exporter and self.video_exporter.is_recording:
+        if self._recording:
             self.video_exporter.capture_frame()
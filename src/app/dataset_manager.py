@@ -2,12 +2,58 @@
 
 import os
 import json
+import functools
+import mmap
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _parse_metadata_file(metadata_path: str) -> dict:
+    """Parse a metadata.json file.
+
+    With orjson the file is memory-mapped and parsed straight from the
+    mapping, so large session files aren't copied into a bytes object first.
+    """
+    if not HAS_ORJSON:
+        with open(metadata_path, 'r') as f:
+            return json.load(f)
+
+    with open(metadata_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap can't map an empty file; let the parser report it
+            return orjson.loads(b"")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+        finally:
+            mm.close()
+
+
+@functools.lru_cache(maxsize=64)
+def _load_metadata(metadata_path: str, mtime: float) -> dict:
+    """Load metadata once per (path, mtime) for the lifetime of the process.
+
+    The returned dict is shared between callers and must be treated as
+    read-only.
+    """
+    return _parse_metadata_file(metadata_path)
+
 
 class DatasetInfo:
     """Information about a loaded dataset."""
 
+    __slots__ = (
+        'name', 'data_dir', 'metadata', 'car_ids', 'total_duration_ms',
+        'session_name', 'track_name', 'display_name', 'car_count',
+        '_duration_string', '_summary',
+    )
+
     def __init__(self, name: str, data_dir: str, metadata: dict):
         self.name = name
         self.data_dir = data_dir
@@ -23,16 +69,19 @@ class DatasetInfo:
         else:
             self.display_name = f"Session - {name}"
 
+        # A loaded dataset doesn't change, so format its strings once
+        self.car_count = len(self.car_ids)
+        minutes, seconds = divmod(int(self.total_duration_ms) // 1000, 60)
+        self._duration_string = f"{minutes}:{seconds:02d}"
+        self._summary = f"{self.display_name} | {self.car_count} cars | {self._duration_string}"
+
     def get_duration_string(self) -> str:
         """Get formatted duration string."""
-        total_seconds = self.total_duration_ms / 1000
-        minutes = int(total_seconds // 60)
-        seconds = int(total_seconds % 60)
-        return f"{minutes}:{seconds:02d}"
+        return self._duration_string
 
     def get_summary(self) -> str:
         """Get one-line summary of dataset."""
-        return f"{self.display_name} | {len(self.car_ids)} cars | {self.get_duration_string()}"
+        return self._summary
 
 
 class DatasetManager:
@@ -42,6 +91,15 @@ class DatasetManager:
         self.datasets: Dict[str, DatasetInfo] = {}  # dataset_id -> DatasetInfo
         self.active_dataset_id: Optional[str] = None
         self.next_dataset_id = 1
+        # Built by get_comparison_data, dropped whenever datasets change
+        self._comparison_cache: Optional[Dict] = None
+        # Bumped on every add/remove/activate so views can skip redundant refreshes
+        self.generation = 0
+
+    def _mark_changed(self):
+        """Record that the dataset set or the active dataset changed."""
+        self._comparison_cache = None
+        self.generation += 1
 
     def add_dataset(self, data_dir: str) -> tuple[str, DatasetInfo]:
         """Add a new dataset to the manager.
@@ -54,8 +112,7 @@ class DatasetManager:
         """
         # Load metadata to get session info
         metadata_path = os.path.join(data_dir, 'metadata.json')
-        with open(metadata_path, 'r') as f:
-            metadata = json.load(f)
+        metadata = _load_metadata(metadata_path, os.path.getmtime(metadata_path))
 
         # Generate unique ID
         dataset_id = f"dataset_{self.next_dataset_id}"
@@ -71,6 +128,7 @@ class DatasetManager:
         # Set as active if it's the first dataset
         if self.active_dataset_id is None:
             self.active_dataset_id = dataset_id
+        self._mark_changed()
 
         print(f"Added dataset: {dataset_info.get_summary()}")
 
@@ -89,6 +147,7 @@ class DatasetManager:
             return False
 
         self.active_dataset_id = dataset_id
+        self._mark_changed()
         print(f"Switched to: {self.datasets[dataset_id].get_summary()}")
         return True
 
@@ -121,11 +180,12 @@ class DatasetManager:
 
         # If removing active dataset, switch to another
         if dataset_id == self.active_dataset_id:
-            remaining_ids = [did for did in self.datasets.keys() if did != dataset_id]
-            if remaining_ids:
-                self.active_dataset_id = remaining_ids[0]
+            self.active_dataset_id = next(
+                (did for did in self.datasets if did != dataset_id), None
+            )
 
         del self.datasets[dataset_id]
+        self._mark_changed()
         return True
 
     def get_dataset_list(self) -> List[tuple[str, DatasetInfo]]:
@@ -140,10 +200,14 @@ class DatasetManager:
         """Get comparison data across all loaded datasets.
 
         Returns:
-            Dictionary with comparison metrics
+            Dictionary with comparison metrics (cached; treat as read-only)
         """
+        if self._comparison_cache is not None:
+            return self._comparison_cache
+
         if not self.datasets:
-            return {}
+            self._comparison_cache = {}
+            return self._comparison_cache
 
         comparison = {
             'dataset_count': len(self.datasets),
@@ -154,7 +218,7 @@ class DatasetManager:
             dataset_data = {
                 'id': dataset_id,
                 'name': info.display_name,
-                'car_count': len(info.car_ids),
+                'car_count': info.car_count,
                 'duration': info.get_duration_string(),
                 'duration_ms': info.total_duration_ms,
                 'track': info.track_name,
@@ -162,4 +226,5 @@ class DatasetManager:
             }
             comparison['datasets'].append(dataset_data)
 
+        self._comparison_cache = comparison
         return comparison
@@ -1,8 +1,15 @@
 """Dataset selection and comparison UI panel."""
 
+from typing import Dict, List, Optional, Tuple
+
 import dearpygui.dearpygui as dpg
 from app.dataset_manager import DatasetManager
 
+# Row styling keyed on whether the dataset is the active one
+_INDICATOR = {True: ("●", (100, 255, 100)), False: ("○", (100, 100, 100))}
+_NAME_COLORS = {True: (255, 255, 255), False: (150, 150, 150)}
+_ACTIVE_COLORS = {True: (100, 255, 100), False: (150, 150, 150)}
+
 
 class DatasetPanel:
     """UI panel for managing and switching between loaded datasets."""
@@ -13,9 +20,28 @@ class DatasetPanel:
         self.panel_tag = "dataset_panel"
         self.is_visible = False
 
+        # What the dataset list currently shows, so updates can diff against it
+        self._rendered_generation = -1
+        self._rendered_ids: Optional[List[str]] = None
+        self._rendered_active_id: Optional[str] = None
+        self._row_tags: Dict[str, Tuple[str, str]] = {}  # id -> (indicator, name)
+
+        # Comparison section, built the first time a second dataset is loaded
+        self._panel_header = None
+        self._comparison_built = False
+        self._comparison_ids: Optional[List[str]] = None
+        self._comparison_rows: Dict[str, Tuple[int, int, int]] = {}  # id -> (name, cars, duration)
+
     def setup_ui(self, parent=None):
         """Create the dataset panel UI."""
-        with dpg.collapsing_header(label="DATASETS", default_open=True, parent=parent):
+        # One click handler shared by every dataset row; rows carry their id as user_data
+        if not dpg.does_item_exist("dataset_row_handler"):
+            with dpg.item_handler_registry(tag="dataset_row_handler"):
+                dpg.add_item_clicked_handler(callback=self._on_dataset_row_clicked)
+
+        with dpg.collapsing_header(label="DATASETS", default_open=True, parent=parent) as header:
+            self._panel_header = header
+
             # Active dataset display
             dpg.add_text("Active Session:", color=(200, 200, 200))
             dpg.add_text("No session loaded", tag="active_dataset_text", color=(150, 150, 150))
@@ -47,59 +73,32 @@ class DatasetPanel:
 
             dpg.add_spacer(height=10)
 
-            # Comparison section (only visible with multiple datasets)
-            with dpg.collapsing_header(label="Comparison", default_open=False, tag="comparison_header", show=False):
-                with dpg.group(tag="comparison_content"):
-                    dpg.add_text("No comparison data", color=(100, 100, 100))
+            # Comparison section is created by _update_comparison once needed
 
     def update_dataset_list(self):
-        """Update the dataset list display."""
-        # Clear existing list
-        if dpg.does_item_exist("dataset_list_group"):
-            dpg.delete_item("dataset_list_group", children_only=True)
+        """Update the dataset list display.
 
-            with dpg.group(tag="dataset_list_group_inner", parent="dataset_list_group"):
-                dataset_list = self.dataset_manager.get_dataset_list()
+        Rows are rebuilt only when the set of datasets changes; switching the
+        active dataset just recolors the existing rows.
+        """
+        generation = self.dataset_manager.generation
+        if generation == self._rendered_generation:
+            return
+        self._rendered_generation = generation
 
-                if not dataset_list:
-                    dpg.add_text("None", color=(100, 100, 100))
-                else:
-                    active_id = self.dataset_manager.active_dataset_id
-
-                    for dataset_id, info in dataset_list:
-                        is_active = (dataset_id == active_id)
-
-                        # Create clickable item for each dataset
-                        with dpg.group(horizontal=True):
-                            # Radio button indicator
-                            if is_active:
-                                dpg.add_text("●", color=(100, 255, 100))
-                            else:
-                                dpg.add_text("○", color=(100, 100, 100))
-
-                            # Dataset name (clickable)
-                            text_color = (255, 255, 255) if is_active else (150, 150, 150)
-                            dpg.add_text(
-                                info.display_name,
-                                color=text_color,
-                                tag=f"dataset_text_{dataset_id}"
-                            )
-
-                            # Make clickable
-                            with dpg.item_handler_registry() as handler:
-                                dpg.add_item_clicked_handler(
-                                    callback=lambda s, a, u: self._on_dataset_click(u),
-                                    user_data=dataset_id
-                                )
-                            dpg.bind_item_handler_registry(f"dataset_text_{dataset_id}", handler)
-
-                        # Dataset info (indented)
-                        with dpg.group(horizontal=True):
-                            dpg.add_text("  ", color=(0, 0, 0, 0))  # Indent
-                            info_text = f"{len(info.car_ids)} cars | {info.get_duration_string()}"
-                            dpg.add_text(info_text, color=(100, 100, 100))
-
-                        dpg.add_spacer(height=5)
+        dataset_list = self.dataset_manager.get_dataset_list()
+        dataset_ids = [dataset_id for dataset_id, _ in dataset_list]
+        active_id = self.dataset_manager.active_dataset_id
+
+        if dataset_ids != self._rendered_ids:
+            self._rebuild_dataset_rows(dataset_list, active_id)
+            self._rendered_ids = dataset_ids
+            self._rendered_active_id = active_id
+        elif active_id != self._rendered_active_id:
+            for dataset_id in (self._rendered_active_id, active_id):
+                if dataset_id in self._row_tags:
+                    self._style_dataset_row(dataset_id, dataset_id == active_id)
+            self._rendered_active_id = active_id
 
         # Update active dataset text
         active_dataset = self.dataset_manager.get_active_dataset()
@@ -118,23 +117,106 @@ class DatasetPanel:
         # Update comparison section
         self._update_comparison()
 
+    def _rebuild_dataset_rows(self, dataset_list, active_id):
+        """Recreate the dataset rows after datasets were added or removed."""
+        if not dpg.does_item_exist("dataset_list_group"):
+            return
+
+        # Hold the render lock so a half-built list is never drawn
+        with dpg.mutex():
+            dpg.delete_item("dataset_list_group", children_only=True)
+            self._row_tags = {}
+            self._build_dataset_rows(dataset_list, active_id)
+
+    def _build_dataset_rows(self, dataset_list, active_id):
+        """Create the dataset rows inside dataset_list_group."""
+        with dpg.group(tag="dataset_list_group_inner", parent="dataset_list_group"):
+            if not dataset_list:
+                dpg.add_text("None", color=(100, 100, 100))
+                return
+
+            # Hoist dpg lookups out of the per-row loop
+            group = dpg.group
+            add_text = dpg.add_text
+            add_spacer = dpg.add_spacer
+            bind_item_handler_registry = dpg.bind_item_handler_registry
+            style_row = self._style_dataset_row
+
+            for dataset_id, info in dataset_list:
+                is_active = (dataset_id == active_id)
+                indicator_tag = f"dataset_indicator_{dataset_id}"
+                name_tag = f"dataset_text_{dataset_id}"
+                self._row_tags[dataset_id] = (indicator_tag, name_tag)
+
+                # Create clickable item for each dataset
+                with group(horizontal=True):
+                    # Radio button indicator
+                    add_text("", tag=indicator_tag)
+
+                    # Dataset name (clickable)
+                    add_text(info.display_name, tag=name_tag, user_data=dataset_id)
+
+                    # Make clickable
+                    bind_item_handler_registry(name_tag, "dataset_row_handler")
+
+                style_row(dataset_id, is_active)
+
+                # Dataset info (indented)
+                with group(horizontal=True):
+                    add_text("  ", color=(0, 0, 0, 0))  # Indent
+                    info_text = f"{info.car_count} cars | {info.get_duration_string()}"
+                    add_text(info_text, color=(100, 100, 100))
+
+                add_spacer(height=5)
+
+    def _style_dataset_row(self, dataset_id: str, is_active: bool):
+        """Set a row's indicator glyph and name color for its active state."""
+        indicator_tag, name_tag = self._row_tags[dataset_id]
+        glyph, glyph_color = _INDICATOR[is_active]
+        dpg.set_value(indicator_tag, glyph)
+        dpg.configure_item(indicator_tag, color=glyph_color)
+        dpg.configure_item(name_tag, color=_NAME_COLORS[is_active])
+
+    def _build_comparison_section(self):
+        """Create the (initially empty) comparison header under the panel."""
+        with dpg.collapsing_header(label="Comparison", default_open=False,
+                                   tag="comparison_header", parent=self._panel_header):
+            dpg.add_group(tag="comparison_content")
+        self._comparison_built = True
+
     def _update_comparison(self):
         """Update the comparison data display."""
         has_multiple = self.dataset_manager.has_multiple_datasets()
 
+        # Single-session use never builds the comparison UI
+        if not self._comparison_built:
+            if not has_multiple or self._panel_header is None:
+                return
+            self._build_comparison_section()
+
         # Show/hide comparison header
-        if dpg.does_item_exist("comparison_header"):
-            dpg.configure_item("comparison_header", show=has_multiple)
+        dpg.configure_item("comparison_header", show=has_multiple)
 
         if not has_multiple:
             return
 
         # Get comparison data
         comparison = self.dataset_manager.get_comparison_data()
+        datasets = comparison['datasets']
+        dataset_ids = [dataset['id'] for dataset in datasets]
+
+        # Same datasets as last time: only the active highlight can differ
+        if dataset_ids == self._comparison_ids:
+            configure_item = dpg.configure_item
+            for dataset in datasets:
+                text_color = _ACTIVE_COLORS[dataset['is_active']]
+                for item in self._comparison_rows[dataset['id']]:
+                    configure_item(item, color=text_color)
+            return
 
-        # Update comparison content
-        if dpg.does_item_exist("comparison_content"):
+        with dpg.mutex():
             dpg.delete_item("comparison_content", children_only=True)
+            self._comparison_rows = {}
 
             with dpg.group(parent="comparison_content"):
                 dpg.add_text(f"Total Sessions: {comparison['dataset_count']}", color=(200, 200, 200))
@@ -152,20 +234,34 @@ class DatasetPanel:
                 dpg.add_separator()
 
                 # Dataset rows
-                for dataset in comparison['datasets']:
-                    text_color = (100, 255, 100) if dataset['is_active'] else (150, 150, 150)
+                group = dpg.group
+                add_text = dpg.add_text
+                add_spacer = dpg.add_spacer
+                for dataset in datasets:
+                    text_color = _ACTIVE_COLORS[dataset['is_active']]
 
-                    with dpg.group(horizontal=True):
+                    with group(horizontal=True):
                         # Name (truncated if too long)
                         name = dataset['name']
                         if len(name) > 20:
                             name = name[:17] + "..."
-                        dpg.add_text(name, color=text_color)
+                        name_item = add_text(name, color=text_color)
+
+                        add_spacer(width=100 - len(name) * 6)
+                        cars_item = add_text(str(dataset['car_count']), color=text_color)
+                        add_spacer(width=40)
+                        duration_item = add_text(dataset['duration'], color=text_color)
+
+                    self._comparison_rows[dataset['id']] = (name_item, cars_item, duration_item)
+
+        self._comparison_ids = dataset_ids
 
-                        dpg.add_spacer(width=100 - len(name) * 6)
-                        dpg.add_text(str(dataset['car_count']), color=text_color)
-                        dpg.add_spacer(width=40)
-                        dpg.add_text(dataset['duration'], color=text_color)
+    def _on_dataset_row_clicked(self, sender, app_data):
+        """Route a click from the shared row handler to the clicked dataset."""
+        # app_data is (mouse_button, clicked_item)
+        dataset_id = dpg.get_item_user_data(app_data[1])
+        if dataset_id is not None:
+            self._on_dataset_click(dataset_id)
 
     def _on_dataset_click(self, dataset_id: str):
         """Handle dataset selection click."""
@@ -1,12 +1,26 @@
 """Demo cursor system for training mode - animated cursor with click feedback."""
 
 import math
+import numpy as np
 import dearpygui.dearpygui as dpg
 
 
 class DemoCursor:
     """Animated cursor for guiding users through demo."""
 
+    # Arrow points relative to the tip (standard cursor shape)
+    _BASE_POINTS = (
+        (0.0, 0.0),     # Tip
+        (0.0, 20.0),    # Bottom of shaft
+        (6.0, 15.0),    # Inner corner
+        (10.0, 24.0),   # Outer finger point
+        (13.0, 22.0),   # Outer finger base
+        (9.0, 13.0),    # Inner finger
+        (15.0, 13.0),   # Right wing
+    )
+    _BASE_POINTS_ARR = np.array(_BASE_POINTS, dtype=np.float64)
+    _BASE_POINTS_ARR.flags.writeable = False
+
     def __init__(self):
         self.visible = True
         self.x = 0.0
@@ -31,6 +45,14 @@ class DemoCursor:
         self.cursor_tag = "demo_cursor"
         self.ripple_tag = "demo_cursor_ripple"
 
+        # Reused buffer for the scaled/translated arrow points
+        self._scaled_points = np.empty_like(self._BASE_POINTS_ARR)
+
+        # Draw item state tracked here instead of querying DPG each frame
+        self._cursor_created = False
+        self._ripple_created = False
+        self._ripple_shown = False
+
     def move_to(self, target_pos, duration=1.0):
         """Animate cursor to target position.
 
@@ -70,8 +92,13 @@ class DemoCursor:
             self.move_progress += delta_time / self.move_duration
             self.move_progress = min(1.0, self.move_progress)
 
-            # Cubic ease-in-out
-            t = self._ease_in_out_cubic(self.move_progress)
+            # Cubic ease-in-out (inlined _ease_in_out_cubic, runs every tick)
+            t = self.move_progress
+            if t < 0.5:
+                t = 4.0 * t * t * t
+            else:
+                u = 2.0 - 2.0 * t
+                t = 1.0 - u * u * u * 0.5
             self.x = self.start_x + (self.target_x - self.start_x) * t
             self.y = self.start_y + (self.target_y - self.start_y) * t
 
@@ -91,23 +118,36 @@ class DemoCursor:
         if not self.visible:
             return
 
+        x, y = self.x, self.y
+        click_active = self.click_active
+        progress = self.click_progress
+
         # Calculate scale for click animation
         scale = 1.0
-        if self.click_active:
+        if click_active:
             # Scale up and down (bounce effect)
-            if self.click_progress < 0.5:
-                scale = 1.0 + (self.click_progress * 2) * 0.3
+            if progress < 0.5:
+                scale = 1.0 + (progress * 2) * 0.3
             else:
-                scale = 1.3 - ((self.click_progress - 0.5) * 2) * 0.3
+                scale = 1.3 - ((progress - 0.5) * 2) * 0.3
 
         # Draw cursor arrow
-        self._draw_cursor_arrow(canvas, self.x, self.y, scale)
+        self._draw_cursor_arrow(canvas, x, y, scale)
 
-        # Draw ripple during click
-        if self.click_active:
-            self._draw_click_ripple(canvas, self.x, self.y, self.click_progress)
+        # Draw ripple during click while it is still visible, hide it otherwise
+        if click_active and int(255 * (1 - progress)) > 2:
+            self._draw_click_ripple(canvas, x, y, progress)
+        else:
+            self._hide_ripple()
 
-    def _ease_in_out_cubic(self, t):
+    def _hide_ripple(self):
+        """Hide the click ripple if it is currently shown."""
+        if self._ripple_shown:
+            dpg.configure_item(self.ripple_tag, show=False)
+            self._ripple_shown = False
+
+    @staticmethod
+    def _ease_in_out_cubic(t):
         """Cubic easing function for smooth movement.
 
         Args:
@@ -117,9 +157,9 @@ class DemoCursor:
             Eased value (0 to 1)
         """
         if t < 0.5:
-            return 4 * t * t * t
-        else:
-            return 1 - pow(-2 * t + 2, 3) / 2
+            return 4.0 * t * t * t
+        u = 2.0 - 2.0 * t
+        return 1.0 - u * u * u * 0.5
 
     def _draw_cursor_arrow(self, canvas, x, y, scale):
         """Draw cursor arrow shape.
@@ -129,23 +169,16 @@ class DemoCursor:
             x, y: Cursor position
             scale: Scale factor for click animation
         """
-        # Arrow points defined relative to origin (standard cursor shape)
-        points = [
-            (0, 0),      # Tip
-            (0, 20),     # Bottom of shaft
-            (6, 15),     # Inner corner
-            (10, 24),    # Outer finger point
-            (13, 22),    # Outer finger base
-            (9, 13),     # Inner finger
-            (15, 13)     # Right wing
-        ]
-
-        # Scale and translate
-        scaled_points = [(x + px * scale, y + py * scale) for px, py in points]
-
-        # Delete old cursor
-        if dpg.does_item_exist(self.cursor_tag):
-            dpg.delete_item(self.cursor_tag)
+        # Scale and translate into the reused point buffer
+        pts = self._scaled_points
+        np.multiply(type(self)._BASE_POINTS_ARR, scale, out=pts)
+        pts += (x, y)
+        scaled_points = pts.tolist()
+
+        # Move the existing cursor; only create it on first render
+        if self._cursor_created:
+            dpg.configure_item(self.cursor_tag, points=scaled_points)
+            return
 
         # Draw white cursor with black outline
         dpg.draw_polygon(
@@ -156,6 +189,7 @@ class DemoCursor:
             parent=canvas,
             tag=self.cursor_tag
         )
+        self._cursor_created = True
 
     def _draw_click_ripple(self, canvas, x, y, progress):
         """Draw expanding ripple for click feedback.
@@ -169,9 +203,17 @@ class DemoCursor:
         radius = 5 + progress * 20
         alpha = int(255 * (1 - progress))
 
-        # Delete old ripple
-        if dpg.does_item_exist(self.ripple_tag):
-            dpg.delete_item(self.ripple_tag)
+        # Update the existing ripple; only create it on first click
+        self._ripple_shown = True
+        if self._ripple_created:
+            dpg.configure_item(
+                self.ripple_tag,
+                center=(x, y),
+                radius=radius,
+                color=(255, 255, 255, alpha),
+                show=True
+            )
+            return
 
         # Draw ripple circle
         dpg.draw_circle(
@@ -182,9 +224,14 @@ class DemoCursor:
             parent=canvas,
             tag=self.ripple_tag
         )
+        self._ripple_created = True
 
     def _cleanup(self):
         """Clean up all cursor rendering elements."""
-        for tag in [self.cursor_tag, self.ripple_tag]:
-            if dpg.does_item_exist(tag):
-                dpg.delete_item(tag)
+        # The items go away with their drawlist, which may be deleted first
+        if self._cursor_created and dpg.does_item_exist(self.cursor_tag):
+            dpg.delete_item(self.cursor_tag)
+        if self._ripple_created and dpg.does_item_exist(self.ripple_tag):
+            dpg.delete_item(self.ripple_tag)
+        self._cursor_created = self._ripple_created = False
+        self._ripple_shown = False
@@ -1,13 +1,51 @@
 """Demo script - complete sequence of training demo steps."""
 
+import functools
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+
+def _freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class DemoStep:
+    """A single step of a demo sequence."""
+    id: str
+    duration: float
+    message: str = ''
+    cursor_target: Optional[tuple] = None
+    cursor_click: bool = False
+    actions: Tuple[Mapping, ...] = ()  # Read-only action specs, keyed by 'type'
+    camera: Optional[Mapping] = None
+
+    @classmethod
+    def from_dict(cls, spec: dict) -> 'DemoStep':
+        """Build a step from its dict definition, freezing nested values."""
+        return cls(**{key: _freeze(value) for key, value in spec.items()})
+
 
 class DemoScript:
     """Container for demo step definitions."""
 
     def __init__(self):
-        self.steps = self._build_steps()
+        self.steps = self._shared_steps()
+
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _shared_steps(cls):
+        """Build the step sequence once per process, frozen so instances can share it."""
+        return tuple(DemoStep.from_dict(spec) for spec in cls._build_steps())
 
-    def _build_steps(self):
+    @staticmethod
+    def _build_steps():
         """Build complete demo sequence.
 
         Returns:
@@ -14,6 +14,30 @@ except ImportError:
     HAS_SCIPY = False
     import math
 
+try:
+    import cupy as cp
+    from cupyx.scipy.ndimage import gaussian_filter as cp_gaussian_filter
+    HAS_CUPY = True
+except ImportError:
+    HAS_CUPY = False
+
+# Below this many points the host->GPU copy costs more than it saves
+CUPY_MIN_POINTS = 1_000_000
+
+
+# (sigma, size) -> read-only normalized kernel
+_KERNEL_CACHE = {}
+
+
+# Density maps are cached on the world itself as world._density_cache:
+# (trajectories version, bins, sigma) -> (density_image, bounds)
+_DENSITY_CACHE_SIZE = 4
+
+
+def clear_density_cache(world):
+    """Drop all density maps cached on a world."""
+    world.__dict__.pop('_density_cache', None)
+
 
 def _gaussian_kernel_1d(sigma, size=None):
     """Create 1D Gaussian kernel for manual convolution."""
@@ -22,38 +46,86 @@ def _gaussian_kernel_1d(sigma, size=None):
         if size % 2 == 0:
             size += 1
 
-    x = np.arange(size) - size // 2
-    kernel = np.exp(-x**2 / (2 * sigma**2))
-    return kernel / kernel.sum()
+    kernel = _KERNEL_CACHE.get((sigma, size))
+    if kernel is None:
+        x = np.arange(size) - size // 2
+        kernel = np.exp(-x**2 / (2 * sigma**2))
+        kernel /= kernel.sum()
+        kernel.flags.writeable = False
+        _KERNEL_CACHE[(sigma, size)] = kernel
+    return kernel
 
 
 def _gaussian_blur_manual(image, sigma):
     """Apply Gaussian blur using separable convolution (fallback if no scipy)."""
     kernel = _gaussian_kernel_1d(sigma)
+    size = len(kernel)
+    pad = size // 2
+    image = np.asarray(image, dtype=float)
 
-    # Horizontal pass
-    result = np.zeros_like(image, dtype=float)
-    pad = len(kernel) // 2
-    padded = np.pad(image, pad, mode='reflect')
-
-    for i in range(image.shape[0]):
-        for j in range(image.shape[1]):
-            result[i, j] = np.sum(padded[i + pad, j:j + len(kernel)] * kernel)
+    # Horizontal pass: (rows, cols, size) windows contracted with the kernel
+    padded = np.pad(image, ((0, 0), (pad, pad)), mode='reflect')
+    windows = np.lib.stride_tricks.sliding_window_view(padded, size, axis=1)
+    result = windows @ kernel
 
     # Vertical pass
-    padded = np.pad(result, pad, mode='reflect')
-    final = np.zeros_like(image, dtype=float)
+    padded = np.pad(result, ((pad, pad), (0, 0)), mode='reflect')
+    windows = np.lib.stride_tricks.sliding_window_view(padded, size, axis=0)
+    return windows @ kernel
+
+
+def _uniform_histogram2d(x, y, bins, hist_range):
+    """2D histogram over uniform bins, already in screen orientation.
+
+    Equivalent to np.histogram2d(x, y).T flipped vertically, but computes
+    bin indices directly and counts them with one bincount.
+
+    Returns:
+        float64 array (bins x bins), row 0 = largest y
+    """
+    (x_min, x_max), (y_min, y_max) = hist_range
+
+    # Like histogram2d: drop points outside the range, last bin includes its right edge
+    inside = (x >= x_min) & (x <= x_max) & (y >= y_min) & (y <= y_max)
+    x = x[inside]
+    y = y[inside]
+
+    ix = ((x - x_min) * (bins / (x_max - x_min))).astype(np.intp)
+    iy = ((y - y_min) * (bins / (y_max - y_min))).astype(np.intp)
+    np.minimum(ix, bins - 1, out=ix)
+    np.minimum(iy, bins - 1, out=iy)
+
+    # Row index counts down from the top so y increases upward on screen
+    flat = (bins - 1 - iy) * bins + ix
+    counts = np.bincount(flat, minlength=bins * bins)
+    return counts.reshape(bins, bins).astype(np.float64)
+
+
+def _smoothed_histogram(x, y, bins, sigma, hist_range):
+    """Smoothed 2D histogram in screen orientation (rows = y, flipped)."""
+    histogram = _uniform_histogram2d(x, y, bins, hist_range)
+
+    # Apply Gaussian smoothing
+    if HAS_SCIPY:
+        return gaussian_filter(histogram, sigma=sigma)
+    return _gaussian_blur_manual(histogram, sigma)
 
-    for i in range(image.shape[0]):
-        for j in range(image.shape[1]):
-            final[i, j] = np.sum(padded[i:i + len(kernel), j + pad] * kernel)
 
-    return final
+def _smoothed_histogram_gpu(x, y, bins, sigma, hist_range):
+    """GPU (CuPy) version of _smoothed_histogram, returned as a NumPy array."""
+    histogram, _, _ = cp.histogram2d(
+        cp.asarray(x), cp.asarray(y), bins=bins, range=hist_range
+    )
+    smoothed = cp_gaussian_filter(cp.flipud(histogram.T), sigma=sigma)
+    return cp.asnumpy(smoothed)
 
 
 def build_density_map(world, bins=400, sigma=2.0):
     """Build density map from all trajectory points.
 
+    Results are cached per world, trajectory version, bins and sigma, so
+    repeated calls for unchanged data return the same (read-only) image.
+
     Args:
         world: WorldModel instance with trajectories and bounds
         bins: Number of histogram bins per dimension
@@ -64,23 +136,44 @@ def build_density_map(world, bins=400, sigma=2.0):
         - density_image: uint8 numpy array (bins x bins)
         - bounds: dict with x_min, x_max, y_min, y_max
     """
-    # Collect all X,Y points from all trajectories
-    all_points = []
-
-    for car_id, traj in world.trajectories.items():
-        # Trajectory columns: [x, y, speed, lapdist, ...]
-        x = traj[:, 0]
-        y = traj[:, 1]
-        points = np.column_stack([x, y])
-        all_points.append(points)
-
-    if len(all_points) == 0:
+    version = getattr(world, 'trajectories_version', None)
+    if version is None:
+        # Worlds without a version counter: fall back to the point count
+        version = sum(traj.shape[0] for traj in world.trajectories.values())
+    cache = world.__dict__.setdefault('_density_cache', {})
+    cache_key = (version, bins, sigma)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = _build_density_map(world, bins, sigma)
+    if result[0] is not None:
+        if len(cache) >= _DENSITY_CACHE_SIZE:
+            cache.clear()
+        cache[cache_key] = result
+    return result
+
+
+def _build_density_map(world, bins, sigma):
+    """Uncached body of build_density_map."""
+    trajectories = list(world.trajectories.values())
+    if len(trajectories) == 0:
         print("Warning: No trajectory points for density map")
         return None, None
 
-    # Combine all points
-    all_points = np.vstack(all_points)
-    print(f"Building density map from {len(all_points):,} points")
+    # Collect all X,Y points from all trajectories into preallocated buffers
+    total = sum(traj.shape[0] for traj in trajectories)
+    xs = np.empty(total, dtype=np.float64)
+    ys = np.empty(total, dtype=np.float64)
+    offset = 0
+    for traj in trajectories:
+        # Trajectory columns: [x, y, speed, lapdist, ...]
+        n = traj.shape[0]
+        xs[offset:offset + n] = traj[:, 0]
+        ys[offset:offset + n] = traj[:, 1]
+        offset += n
+
+    print(f"Building density map from {total:,} points")
 
     # Get world bounds
     bounds = world.bounds
@@ -94,23 +187,12 @@ def build_density_map(world, bins=400, sigma=2.0):
     y_min -= margin
     y_max += margin
 
-    # Create 2D histogram
-    histogram, x_edges, y_edges = np.histogram2d(
-        all_points[:, 0], all_points[:, 1],
-        bins=bins,
-        range=[[x_min, x_max], [y_min, y_max]]
-    )
-
-    # Transpose and flip for correct screen orientation
-    # histogram2d returns [x, y] but we want [row, col] with y increasing downward for screen
-    histogram = histogram.T
-    histogram = np.flipud(histogram)  # Flip vertically for screen coordinates
-
-    # Apply Gaussian smoothing
-    if HAS_SCIPY:
-        smoothed = gaussian_filter(histogram, sigma=sigma)
+    # Create smoothed 2D histogram, on the GPU for very large point sets
+    hist_range = [[x_min, x_max], [y_min, y_max]]
+    if HAS_CUPY and total >= CUPY_MIN_POINTS:
+        smoothed = _smoothed_histogram_gpu(xs, ys, bins, sigma, hist_range)
     else:
-        smoothed = _gaussian_blur_manual(histogram, sigma)
+        smoothed = _smoothed_histogram(xs, ys, bins, sigma, hist_range)
 
     # Normalize to 0-255
     if smoothed.max() > 0:
@@ -128,12 +210,39 @@ def build_density_map(world, bins=400, sigma=2.0):
 
     print(f"Density map created: {normalized.shape}, range [{normalized.min()}, {normalized.max()}]")
 
+    normalized.flags.writeable = False
+
     return normalized, actual_bounds
 
 
+_DENSITY_LUT = None
+
+# texture tag -> (shape, content hash) of the image last uploaded to it
+_LAST_TEXTURE_KEY = {}
+
+
+def _density_lut():
+    """(256, 4) float32 table mapping a density byte to its RGBA color."""
+    global _DENSITY_LUT
+    if _DENSITY_LUT is None:
+        # Normalize to 0-1 for DearPyGUI
+        vals = np.arange(256, dtype=np.float32) / 255.0
+        _DENSITY_LUT = np.stack([
+            vals * 0.4,                 # R - subtle gray
+            vals * 0.4,                 # G
+            vals * 0.45,                # B - slight blue tint
+            np.clip(vals * 1.5, 0, 1),  # A - more transparent for low density
+        ], axis=1).astype(np.float32)
+        _DENSITY_LUT.flags.writeable = False
+    return _DENSITY_LUT
+
+
 def density_map_to_texture(image, tag="density_texture"):
     """Convert density map to DearPyGUI texture.
 
+    An existing texture is reused: unchanged images are not uploaded again,
+    and same-sized images update it in place.
+
     Args:
         image: 2D uint8 numpy array (grayscale density)
         tag: Tag for the texture
@@ -142,29 +251,29 @@ def density_map_to_texture(image, tag="density_texture"):
         Texture tag string
     """
     height, width = image.shape
+    texture_key = (image.shape, hash(image.tobytes()))
+    texture_exists = dpg.does_item_exist(tag)
+    if texture_exists and _LAST_TEXTURE_KEY.get(tag) == texture_key:
+        return tag
 
-    # Convert grayscale to RGBA
-    # Map intensity to color and alpha
+    # Convert grayscale to RGBA with one lookup per pixel
     # Low intensity = transparent, high intensity = visible gray
-    rgba = np.zeros((height, width, 4), dtype=np.float32)
-
-    # Normalize to 0-1 for DearPyGUI
-    normalized = image.astype(np.float32) / 255.0
-
-    # Color channels (gray)
-    rgba[:, :, 0] = normalized * 0.4  # R - subtle gray
-    rgba[:, :, 1] = normalized * 0.4  # G
-    rgba[:, :, 2] = normalized * 0.45  # B - slight blue tint
+    rgba = _density_lut()[image]
 
-    # Alpha channel - more transparent for low density
-    rgba[:, :, 3] = np.clip(normalized * 1.5, 0, 1)
+    # Flatten for DearPyGUI; it reads contiguous float32 buffers directly,
+    # so no per-element Python list is needed
+    flat_data = rgba.ravel()
 
-    # Flatten for DearPyGUI
-    flat_data = rgba.flatten().tolist()
+    # Same size: update the existing texture in place
+    last_key = _LAST_TEXTURE_KEY.get(tag)
+    if texture_exists and last_key is not None and last_key[0] == image.shape:
+        dpg.set_value(tag, flat_data)
+        _LAST_TEXTURE_KEY[tag] = texture_key
+        return tag
 
     # Create texture in DearPyGUI
     with dpg.texture_registry():
-        if dpg.does_item_exist(tag):
+        if texture_exists:
             dpg.delete_item(tag)
 
         dpg.add_dynamic_texture(
@@ -173,5 +282,6 @@ def density_map_to_texture(image, tag="density_texture"):
             default_value=flat_data,
             tag=tag
         )
+    _LAST_TEXTURE_KEY[tag] = texture_key
 
     return tag
@@ -5,25 +5,55 @@ deviation from the optimal racing line. HUD-style rendering with
 fixed pixel sizes regardless of zoom.
 """
 
+import functools
 import math
+import numpy as np
 import dearpygui.dearpygui as dpg
-from app.color_config import color_config
+from app.color_config import get_color_config
+
+# Line thickness of a bar fill
+BAR_THICKNESS = 3
+
+# car_id -> tags of the 10 fill lines created for that car
+_bar_tags = {}
+
+# Lower edge of each bar's 0.2-wide band of |deviation|
+_THRESH_LOW = np.array([0.0, 0.2, 0.4, 0.6, 0.8])
+
+# Distance from car center to first bar
+BASE_OFFSET = 15
+
+
+# (config, config version, colors) from the last get_deviation_colors call
+_colors_cache = (None, -1, None)
 
 
 def get_deviation_colors():
-    """Get deviation bar colors from config."""
-    colors = color_config.get_deviation_colors()
-    return colors['right'], colors['left'], colors['inactive']
+    """Get deviation bar colors from config.
+
+    The unpacked tuple is reused until the color config changes.
+    """
+    global _colors_cache
+    config = get_color_config()
+    cached_config, cached_version, cached_colors = _colors_cache
+    if cached_config is config and cached_version == config.version:
+        return cached_colors
+
+    colors = config.get_deviation_colors()
+    result = (colors['right'], colors['left'], colors['inactive'])
+    _colors_cache = (config, config.version, result)
+    return result
 
 
 class DeviationBarState:
     """Animation state for deviation bars of a single car."""
 
-    def __init__(self):
+    def __init__(self, current_fills=None, target_fills=None):
         # Current fill levels for each bar (0 to 1)
         # Index 0-4 = left bars, 5-9 = right bars
-        self.current_fills = [0.0] * 10
-        self.target_fills = [0.0] * 10
+        # May be row views into a DeviationAnimator's shared arrays
+        self.current_fills = np.zeros(10) if current_fills is None else current_fills
+        self.target_fills = np.zeros(10) if target_fills is None else target_fills
 
     def update(self, dt_ms: float):
         """Smooth animation interpolation.
@@ -34,77 +64,148 @@ class DeviationBarState:
         # Exponential smoothing factor (150-250ms response)
         alpha = min(1.0, dt_ms / 150.0)
 
-        for i in range(10):
-            diff = self.target_fills[i] - self.current_fills[i]
-            self.current_fills[i] += diff * alpha
+        self.current_fills += (self.target_fills - self.current_fills) * alpha
+
+
+class DeviationAnimator:
+    """Bar animation state for all cars, smoothed in one vectorized step.
+
+    Each car's DeviationBarState views one row of shared (cars x 10) arrays,
+    so a single update() call advances all drawn cars at once.
+    """
+
+    def __init__(self, capacity: int = 32):
+        self._current = np.zeros((capacity, 10))
+        self._target = np.zeros((capacity, 10))
+        self._states = {}  # car_id -> DeviationBarState
+        self._rows = {}  # car_id -> row in the shared arrays
+
+    def state(self, car_id: str) -> DeviationBarState:
+        """Get (or create) the animation state for a car."""
+        bar_state = self._states.get(car_id)
+        if bar_state is None:
+            row = len(self._states)
+            if row == len(self._current):
+                self._grow()
+            bar_state = DeviationBarState(self._current[row], self._target[row])
+            self._states[car_id] = bar_state
+            self._rows[car_id] = row
+        return bar_state
+
+    def _grow(self):
+        """Double the capacity and re-point existing states at the new rows."""
+        capacity = len(self._current) * 2
+        current = np.zeros((capacity, 10))
+        target = np.zeros((capacity, 10))
+        used = len(self._states)
+        current[:used] = self._current[:used]
+        target[:used] = self._target[:used]
+        self._current, self._target = current, target
+        for row, bar_state in enumerate(self._states.values()):
+            bar_state.current_fills = current[row]
+            bar_state.target_fills = target[row]
+
+    def update(self, dt_ms: float, car_ids):
+        """Advance the smoothing of the given cars' bars.
+
+        Args:
+            dt_ms: Time delta in milliseconds
+            car_ids: Cars whose bars are drawn this frame
+        """
+        rows = [self._rows[car_id] for car_id in car_ids]
+        if not rows:
+            return
+        alpha = min(1.0, dt_ms / 150.0)
+        current = self._current[rows]
+        current += (self._target[rows] - current) * alpha
+        self._current[rows] = current
 
 
-def compute_bar_fills(deviation_score: float) -> list:
+def compute_bar_fills(deviation_score: float, out=None):
     """Compute target fill levels for all 10 bars.
 
     Args:
         deviation_score: Value in [-1, 1]
             negative = left of racing line
             positive = right of racing line
+        out: Optional 10-element array to write the fills into
 
     Returns:
-        List of 10 fill values (0 to 1)
+        10 fill values (0 to 1), as a list or `out` if given
         Index 0-4 = left bars (activate on negative)
         Index 5-9 = right bars (activate on positive)
     """
-    fills = [0.0] * 10
-
     # Clamp score to valid range
     score = max(-1.0, min(1.0, deviation_score))
 
+    # Each bar fills linearly across its band: empty below, full above
+    bars = np.clip((abs(score) - _THRESH_LOW) / 0.2, 0.0, 1.0)
+
+    fills = np.zeros(10) if out is None else out
     if score < 0:
-        # Left deviation - fill left bars
-        abs_score = abs(score)
-        for i in range(5):
-            threshold = (i + 1) * 0.2  # 0.2, 0.4, 0.6, 0.8, 1.0
-            if abs_score >= threshold:
-                fills[i] = 1.0
-            elif abs_score > threshold - 0.2:
-                # Partial fill within this bar's band
-                within_band = (abs_score - (threshold - 0.2)) / 0.2
-                fills[i] = within_band
-            else:
-                fills[i] = 0.0
+        fills[:5] = bars  # Left deviation - fill left bars
+        fills[5:] = 0.0
     else:
-        # Right deviation - fill right bars
-        for i in range(5):
-            threshold = (i + 1) * 0.2  # 0.2, 0.4, 0.6, 0.8, 1.0
-            if score >= threshold:
-                fills[5 + i] = 1.0
-            elif score > threshold - 0.2:
-                # Partial fill within this bar's band
-                within_band = (score - (threshold - 0.2)) / 0.2
-                fills[5 + i] = within_band
-            else:
-                fills[5 + i] = 0.0
+        fills[:5] = 0.0
+        fills[5:] = bars  # Right deviation - fill right bars
 
-    return fills
+    return fills.tolist() if out is None else out
 
 
 def delete_deviation_bars(car_id: str):
     """Delete all deviation bar elements for a car.
 
+    Cheap to call every frame: cars without bars are skipped without
+    touching DearPyGUI.
+
     Args:
         car_id: Unique identifier for the car
     """
-    for i in range(10):
-        outline_tag = f"devbar_outline_{car_id}_{i}"
-        fill_tag = f"devbar_fill_{car_id}_{i}"
-        if dpg.does_item_exist(outline_tag):
-            dpg.delete_item(outline_tag)
-        if dpg.does_item_exist(fill_tag):
-            dpg.delete_item(fill_tag)
+    tags = _bar_tags.pop(car_id, None)
+    if tags is None:
+        return
+    for tag in tags:
+        if dpg.does_item_exist(tag):
+            dpg.delete_item(tag)
+
+
+def _ensure_bars(car_id: str, drawlist) -> tuple:
+    """Create the 10 (hidden) fill lines for a car on first use.
+
+    Returns:
+        Tuple of the fill line tags, index 0-4 = left, 5-9 = right
+    """
+    tags = _bar_tags.get(car_id)
+    if tags is None:
+        tags = tuple(f"devbar_fill_{car_id}_{i}" for i in range(10))
+        for tag in tags:
+            dpg.draw_line([0, 0], [0, 0], thickness=BAR_THICKNESS,
+                          parent=drawlist, tag=tag, show=False)
+        _bar_tags[car_id] = tags
+    return tags
+
+
+@functools.lru_cache(maxsize=8)
+def _bar_offsets(bar_length) -> np.ndarray:
+    """Signed perpendicular offset of each bar center for a bar length.
+
+    Left bars (0-4) are positive, right bars (5-9) negative.
+    """
+    spacing = max(5, bar_length // 3)  # Space scales with bar length
+    offsets = BASE_OFFSET + np.arange(5) * spacing
+    signed = np.concatenate((offsets, -offsets)).astype(float)
+    signed.flags.writeable = False
+    return signed
 
 
 def draw_deviation_bars(screen_x: float, screen_y: float, heading_rad: float,
                         bar_state: DeviationBarState, drawlist, car_id: str):
     """Draw deviation bars around a car in screen space.
 
+    The bar lines are created once per car and moved with configure_item
+    on later frames. Use draw_all_deviation_bars to batch several cars
+    under one lock.
+
     Args:
         screen_x, screen_y: Car position in screen coordinates (pixels)
         heading_rad: Car heading in radians
@@ -112,14 +213,13 @@ def draw_deviation_bars(screen_x: float, screen_y: float, heading_rad: float,
         drawlist: DearPyGUI drawlist parent
         car_id: Unique identifier for tagging draw elements
     """
-    # Delete old bars first
-    delete_deviation_bars(car_id)
+    tags = _ensure_bars(car_id, drawlist)
+    configure_item = dpg.configure_item
+    neon_pink, neon_blue, _ = get_deviation_colors()
 
     # Bar geometry from config
-    bar_length = color_config.get_size('deviation_bar_length')
-    BAR_WIDTH = 4            # Thickness of each bar
-    BASE_OFFSET = 15         # Distance from car center to first bar
-    BAR_SPACING = max(5, bar_length // 3)  # Space scales with bar length
+    bar_length = get_color_config().get_size('deviation_bar_length')
+    offsets = _bar_offsets(bar_length)
 
     # Compute direction vectors
     # Forward direction from heading
@@ -130,60 +230,38 @@ def draw_deviation_bars(screen_x: float, screen_y: float, heading_rad: float,
     px = -fy
     py = fx
 
-    # Draw left bars (indices 0-4)
-    for i in range(5):
-        bar_idx = i
-        fill = bar_state.current_fills[bar_idx]
-
-        # Calculate bar center position (offset left from car)
-        offset = BASE_OFFSET + i * BAR_SPACING
-        center_x = screen_x + px * offset
-        center_y = screen_y + py * offset
-
-        # Bar endpoints (oriented along forward direction)
-        half_len = bar_length / 2
-        x1 = center_x - fx * half_len
-        y1 = center_y - fy * half_len
-        x2 = center_x + fx * half_len
-        y2 = center_y + fy * half_len
-
-        # Draw fill if active (from center outward)
-        if fill > 0.01:
-            fill_half = half_len * fill
-            fx1 = center_x - fx * fill_half
-            fy1 = center_y - fy * fill_half
-            fx2 = center_x + fx * fill_half
-            fy2 = center_y + fy * fill_half
-            fill_tag = f"devbar_fill_{car_id}_{bar_idx}"
-            neon_pink, neon_blue, _ = get_deviation_colors()
-            dpg.draw_line([fx1, fy1], [fx2, fy2], color=neon_blue,
-                         thickness=BAR_WIDTH - 1, parent=drawlist, tag=fill_tag)
-
-    # Draw right bars (indices 5-9)
-    for i in range(5):
-        bar_idx = 5 + i
-        fill = bar_state.current_fills[bar_idx]
-
-        # Calculate bar center position (offset right from car)
-        offset = BASE_OFFSET + i * BAR_SPACING
-        center_x = screen_x - px * offset  # Negative perpendicular = right
-        center_y = screen_y - py * offset
-
-        # Bar endpoints
-        half_len = bar_length / 2
-        x1 = center_x - fx * half_len
-        y1 = center_y - fy * half_len
-        x2 = center_x + fx * half_len
-        y2 = center_y + fy * half_len
-
-        # Draw fill if active
-        if fill > 0.01:
-            fill_half = half_len * fill
-            fx1 = center_x - fx * fill_half
-            fy1 = center_y - fy * fill_half
-            fx2 = center_x + fx * fill_half
-            fy2 = center_y + fy * fill_half
-            fill_tag = f"devbar_fill_{car_id}_{bar_idx}"
-            neon_pink, neon_blue, _ = get_deviation_colors()
-            dpg.draw_line([fx1, fy1], [fx2, fy2], color=neon_pink,
-                         thickness=BAR_WIDTH - 1, parent=drawlist, tag=fill_tag)
+    # Fill segments for all 10 bars at once, centered on each bar and
+    # oriented along the forward direction: rows of [x1, y1, x2, y2]
+    fills = bar_state.current_fills
+    center_x = screen_x + px * offsets
+    center_y = screen_y + py * offsets
+    fill_half = fills * (bar_length / 2)
+    dx = fx * fill_half
+    dy = fy * fill_half
+    segments = np.stack(
+        (center_x - dx, center_y - dy, center_x + dx, center_y + dy), axis=1
+    ).tolist()
+    visible = (fills > 0.01).tolist()
+
+    for bar_idx in range(10):
+        if visible[bar_idx]:
+            x1, y1, x2, y2 = segments[bar_idx]
+            # Left bars (0-4) blue, right bars (5-9) pink
+            color = neon_blue if bar_idx < 5 else neon_pink
+            configure_item(tags[bar_idx], p1=[x1, y1], p2=[x2, y2],
+                           color=color, show=True)
+        else:
+            configure_item(tags[bar_idx], show=False)
+
+
+def draw_all_deviation_bars(cars, drawlist):
+    """Draw deviation bars for several cars under a single DearPyGUI lock.
+
+    Args:
+        cars: Iterable of (screen_x, screen_y, heading_rad, bar_state, car_id)
+        drawlist: DearPyGUI drawlist parent
+    """
+    with dpg.mutex():
+        for screen_x, screen_y, heading_rad, bar_state, car_id in cars:
+            draw_deviation_bars(screen_x, screen_y, heading_rad, bar_state,
+                                drawlist, car_id)
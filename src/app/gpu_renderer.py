@@ -5,8 +5,9 @@ import dearpygui.dearpygui as dpg
 import numpy as np
 
 from app.density_map import build_density_map, density_map_to_texture
-from app.deviation_bars import DeviationBarState, compute_bar_fills, draw_deviation_bars, delete_deviation_bars
-from app.color_config import color_config
+from app.deviation_bars import DeviationAnimator, compute_bar_fills, draw_all_deviation_bars, delete_deviation_bars
+from app.color_config import get_color_config
+from app.color_kernels import interp_gradient_u8
 from rendering.lap_delta_renderer import LapDeltaRenderer
 
 
@@ -41,7 +42,7 @@ class GPURenderer:
         self.density_initialized = False
 
         # Deviation bar animation state per car
-        self.deviation_bar_states = {}  # car_id -> DeviationBarState
+        self.deviation_animator = DeviationAnimator()  # Per-car bar animation state
         self.last_frame_time_ms = 0
 
         # HUD toggle regions for click detection
@@ -261,7 +262,7 @@ class GPURenderer:
             points.append(points[0])
 
         # Draw polyline on canvas (thin line, lower opacity)
-        track_colors = color_config.get_track_colors()
+        track_colors = get_color_config().get_track_colors()
         dpg.draw_polyline(points, color=track_colors['racing_line'], thickness=1,
                          closed=True, parent=self.canvas, tag="track_line")
 
@@ -287,7 +288,7 @@ class GPURenderer:
             points.append(points[0])
 
         # Draw polyline (thicker, bright color for visibility)
-        track_colors = color_config.get_track_colors()
+        track_colors = get_color_config().get_track_colors()
         dpg.draw_polyline(points, color=track_colors['outline'], thickness=3,
                          closed=True, parent=self.canvas, tag="track_outline")
 
@@ -331,7 +332,7 @@ class GPURenderer:
             points.append(points[0])
 
         # Draw polyline using configured color
-        track_colors = color_config.get_track_colors()
+        track_colors = get_color_config().get_track_colors()
         dpg.draw_polyline(points, color=track_colors['global_racing_line'], thickness=2,
                          closed=True, parent=self.canvas, tag="global_racing_line")
 
@@ -350,7 +351,7 @@ class GPURenderer:
                 dpg.delete_item(label_tag)
 
         # Get sector colors
-        sector_colors = color_config.get_sector_timing_colors()
+        sector_colors = get_color_config().get_sector_timing_colors()
 
         # Draw each sector boundary
         for i in range(len(self.world.sector_boundaries)):
@@ -385,7 +386,7 @@ class GPURenderer:
 
     def get_brake_color(self, intensity: float, brake_type: str = 'front') -> tuple:
         """Get brake glow color based on intensity and type (front/rear)."""
-        return color_config.get_brake_color(intensity, brake_type)
+        return get_color_config().get_brake_color(intensity, brake_type)
 
     def _draw_brake_arc(self, px, py, heading_rad, intensity, base_radius, is_front, car_id):
         """Draw brake as oriented semi-circle ring that expands with intensity."""
@@ -399,7 +400,7 @@ class GPURenderer:
 
         # Calculate expanding radius based on intensity
         # Ring expands from base_radius based on configured max size
-        max_expansion = color_config.get_size('brake_arc_max_radius') / 8  # Scale from config
+        max_expansion = get_color_config().get_size('brake_arc_max_radius') / 8  # Scale from config
         ring_radius = base_radius + (max_expansion * intensity)
 
         # Account for screen Y-flip
@@ -539,7 +540,7 @@ class GPURenderer:
             return
 
         # Get max expansion size from config
-        max_size = color_config.get_size('accel_display_size')
+        max_size = get_color_config().get_size('accel_display_size')
 
         # Fill radius expands with intensity
         fill_radius = radius * (0.3 + (max_size / 15.0) * intensity)
@@ -593,6 +594,7 @@ class GPURenderer:
         highlight = self.world.highlight_selected
         show_brake = self.world.show_braking_overlay
         is_any_selected = len(selected) > 0
+        pending_bars = []  # Deviation bars are drawn after the loop in one batch
 
         for car_id, state in car_states.items():
             # Skip hidden cars - delete all their visual elements
@@ -726,21 +728,16 @@ class GPURenderer:
                     heading_rad = state.get('heading', 0)
 
                     # Get or create animation state for this car
-                    if car_id not in self.deviation_bar_states:
-                        self.deviation_bar_states[car_id] = DeviationBarState()
-                    bar_state = self.deviation_bar_states[car_id]
+                    bar_state = self.deviation_animator.state(car_id)
 
                     # Normalize deviation to [-1, 1] range
                     deviation_score = max(-1.0, min(1.0, deviation / 2.0))
 
                     # Update target fills based on deviation
-                    bar_state.target_fills = compute_bar_fills(deviation_score)
+                    compute_bar_fills(deviation_score, out=bar_state.target_fills)
 
-                    # Update animation (use 16ms as approximate frame time)
-                    bar_state.update(16.0)
-
-                    # Draw the bars in screen space
-                    draw_deviation_bars(px, py, -heading_rad, bar_state, self.canvas, car_id)
+                    # Queue the bars for drawing in screen space
+                    pending_bars.append((px, py, -heading_rad, bar_state, car_id))
                 else:
                     # Remove deviation bars if disabled
                     delete_deviation_bars(car_id)
@@ -817,12 +814,17 @@ class GPURenderer:
                 # Remove deviation bars if not selected
                 delete_deviation_bars(car_id)
 
+        if pending_bars:
+            # Advance the drawn cars' bar animations at once (16ms approximate frame time)
+            self.deviation_animator.update(16.0, [entry[4] for entry in pending_bars])
+            draw_all_deviation_bars(pending_bars, self.canvas)
+
     def get_accel_color(self, accel_norm: float, alpha: int = 200) -> tuple:
         """Get color based on normalized acceleration (0-1).
 
         Color mapping interpolates between low, medium, high colors.
         """
-        accel_colors = color_config.get_acceleration_colors()
+        accel_colors = get_color_config().get_acceleration_colors()
         low = accel_colors['low']
         mid = accel_colors['medium']
         high = accel_colors['high']
@@ -848,7 +850,7 @@ class GPURenderer:
         Color mapping interpolates between slower (blue), baseline (green), faster (red).
         Range: -30 to +30 km/h
         """
-        delta_colors = color_config.get_delta_speed_colors()
+        delta_colors = get_color_config().get_delta_speed_colors()
         slower = delta_colors['slower']
         baseline = delta_colors['baseline']
         faster = delta_colors['faster']
@@ -905,6 +907,10 @@ class GPURenderer:
         highlight = self.world.highlight_selected
         is_any_selected = len(selected) > 0
 
+        # Gradient stops, fetched once per frame rather than per segment
+        accel_stops = get_color_config().get_gradient_stops('acceleration_heatmap')
+        delta_stops = get_color_config().get_gradient_stops('delta_speed')
+
         for i, car_id in enumerate(self.world.car_ids):
             # Skip hidden cars
             if car_id in self.world.hidden_car_ids:
@@ -923,7 +929,7 @@ class GPURenderer:
                     continue
 
                 # Calculate trail window based on configured duration
-                trail_duration = color_config.get_size('trail_duration_s')
+                trail_duration = get_color_config().get_size('trail_duration_s')
                 trail_frames = trail_duration * 100  # 100Hz sampling rate
                 current_idx = int(self.world.current_time_ms / 10)
                 start_idx = max(0, current_idx - trail_frames)
@@ -934,26 +940,30 @@ class GPURenderer:
                 if current_idx - start_idx < 2:
                     continue
 
+                # Segment colors for the whole window in one vectorized pass
+                window = traj[start_idx:current_idx + 1]
+                # Support both 10-column (old) and 11-column (new) formats
+                accel_col = 9 if traj.shape[1] >= 11 else 8
+                if traj.shape[1] > accel_col:
+                    accel = window[:, accel_col]
+                    avg_accel = (accel[:-1] + accel[1:]) / 2  # Average of segment
+                else:
+                    avg_accel = np.zeros(len(window) - 1)
+                rgb = interp_gradient_u8(avg_accel, accel_stops).tolist()
+
+                # Fade alpha based on age, over the trail duration
+                ages = current_idx - np.arange(start_idx, current_idx)
+                alphas = (200 * np.maximum(0.1, 1.0 - ages / trail_frames)).astype(int).tolist()
+
                 # Draw individual segments with acceleration-based colors
                 for seg_idx in range(start_idx, current_idx):
                     # Get positions
                     x1, y1 = float(traj[seg_idx, 0]), float(traj[seg_idx, 1])
                     x2, y2 = float(traj[seg_idx + 1, 0]), float(traj[seg_idx + 1, 1])
 
-                    # Get acceleration (use average of segment)
-                    # Support both 10-column (old) and 11-column (new) formats
-                    accel_col = 9 if traj.shape[1] >= 11 else 8
-                    accel1 = float(traj[seg_idx, accel_col]) if traj.shape[1] > accel_col else 0.0
-                    accel2 = float(traj[seg_idx + 1, accel_col]) if traj.shape[1] > accel_col else 0.0
-                    avg_accel = (accel1 + accel2) / 2
-
-                    # Compute fade alpha based on age
-                    age = current_idx - seg_idx
-                    fade = 1.0 - (age / trail_frames)  # Fade over trail duration
-                    alpha = int(200 * max(0.1, fade))
-
-                    # Get color based on acceleration
-                    color = self.get_accel_color(avg_accel, alpha)
+                    k = seg_idx - start_idx
+                    r, g, b = rgb[k]
+                    color = (r, g, b, alphas[k])
 
                     # Convert to screen coordinates
                     px1, py1 = self.world_to_screen(x1, y1)
@@ -979,27 +989,28 @@ class GPURenderer:
                     continue
 
                 # Get custom trail duration from settings
-                trail_duration = color_config.get_size('trail_duration_s')
+                trail_duration = get_color_config().get_size('trail_duration_s')
 
                 # Get delta speed trail data (dynamic, follows car)
                 trail_points = self.world.get_delta_speed_trail(car_id, trail_duration)
                 if len(trail_points) < 2:
                     continue
 
+                # Segment colors from average delta, normalized so that
+                # -30 km/h -> 0, baseline -> 0.5, +30 km/h -> 1
+                deltas = np.array([p[2] for p in trail_points], dtype=np.float64)
+                avg_delta = (deltas[:-1] + deltas[1:]) / 2
+                rgb = interp_gradient_u8((avg_delta + 30) / 60, delta_stops).tolist()
+
                 # Draw individual segments with delta speed-based colors
                 # Use lower alpha to not obscure the animation
                 for seg_idx in range(len(trail_points) - 1):
-                    x1, y1, delta1 = trail_points[seg_idx]
-                    x2, y2, delta2 = trail_points[seg_idx + 1]
-
-                    # Use average delta for segment color
-                    avg_delta = (delta1 + delta2) / 2
+                    x1, y1, _ = trail_points[seg_idx]
+                    x2, y2, _ = trail_points[seg_idx + 1]
 
                     # Lower alpha so it doesn't dominate - this is reference data
-                    alpha = 120
-
-                    # Get color based on delta speed
-                    color = self.get_delta_speed_color(avg_delta, alpha)
+                    r, g, b = rgb[seg_idx]
+                    color = (r, g, b, 120)
 
                     # Convert to screen coordinates
                     px1, py1 = self.world_to_screen(x1, y1)
@@ -1023,7 +1034,7 @@ class GPURenderer:
                 trail = self.world.get_fading_trail(car_id, 10)
             elif trail_mode == 'Custom':
                 # Use duration from color config settings
-                custom_duration = color_config.get_size('trail_duration_s')
+                custom_duration = get_color_config().get_size('trail_duration_s')
                 trail = self.world.get_fading_trail(car_id, custom_duration)
             else:
                 trail = []
@@ -1223,7 +1234,7 @@ class GPURenderer:
         # Draw time with racing-style color coding
         # Red for minutes, Orange for seconds, Green for milliseconds
         time_y = timer_y + 18
-        timer_colors = color_config.get_race_timer_colors()
+        timer_colors = get_color_config().get_race_timer_colors()
 
         # Minutes (red)
         min_text = f"{minutes:02d}"
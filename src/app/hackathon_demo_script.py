@@ -6,12 +6,14 @@ Just start the app, load data, and run this demo - record your screen!
 Category: Post-event Analysis + Driver Training/Insights
 """
 
+from app.demo_script import DemoStep
+
 
 class HackathonDemoScript:
     """2.5 minute winning demo sequence for TRD Hackathon 2024."""
 
     def __init__(self):
-        self.steps = self._build_hackathon_steps()
+        self.steps = tuple(DemoStep.from_dict(spec) for spec in self._build_hackathon_steps())
 
     def _build_hackathon_steps(self):
         """Build optimized 2.5 minute demo sequence.
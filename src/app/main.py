@@ -97,7 +97,7 @@ class RaceReplayApp:
                            resizable=True)
 
         # Set up state change callback
-        self.state_manager.set_state_change_callback(self._on_state_change)
+        self.state_manager.add_listener(self._on_state_change)
 
         # HACKATHON MODE: Auto-load processed data
         if os.environ.get('HACKATHON_DEMO') == '1':
@@ -146,7 +146,7 @@ class RaceReplayApp:
 
     def _on_state_change(self, old_state: AppState, new_state: AppState):
         """Handle state transitions."""
-        print(f"State: {old_state.value} -> {new_state.value}")
+        print(f"State: {old_state.name} -> {new_state.name}")
 
         if new_state == AppState.PROCESSING:
             self.loading_screen.update_for_state(new_state)
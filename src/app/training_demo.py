@@ -381,7 +381,7 @@ class DemoStateManager:
         step = self.script.steps[self.current_step_index]
         step_elapsed = time.time() - self.step_start_time
 
-        if step_elapsed >= step['duration']:
+        if step_elapsed >= step.duration:
             self._advance_to_next_step()
 
         return True
@@ -401,20 +401,20 @@ class DemoStateManager:
             return
 
         step = self.script.steps[step_index]
-        print(f"Demo step {step_index + 1}/{len(self.script.steps)}: {step['id']}")
+        print(f"Demo step {step_index + 1}/{len(self.script.steps)}: {step.id}")
 
         # Show message
-        if step.get('message'):
-            show_message(step['message'], duration=step['duration'])
+        if step.message:
+            show_message(step.message, duration=step.duration)
 
         # Move cursor
-        if step.get('cursor_target'):
-            target_pos = self._resolve_cursor_target(step['cursor_target'])
+        if step.cursor_target:
+            target_pos = self._resolve_cursor_target(step.cursor_target)
             if target_pos:
                 self.cursor.move_to(target_pos, duration=1.0)
 
                 # Trigger click animation if specified
-                if step.get('cursor_click'):
+                if step.cursor_click:
                     # Schedule click after cursor reaches target (handled here, not via action_executor)
                     # Will trigger in update loop when cursor reaches target
                     self._cursor_click_scheduled = True
@@ -423,13 +423,13 @@ class DemoStateManager:
             self._cursor_click_scheduled = False
 
         # Execute actions
-        if step.get('actions'):
-            for action in step['actions']:
+        if step.actions:
+            for action in step.actions:
                 self.action_executor.execute(action)
 
         # Camera movement
-        if step.get('camera'):
-            self.camera_controller.animate_to(step['camera'])
+        if step.camera:
+            self.camera_controller.animate_to(step.camera)
 
     def _advance_to_next_step(self):
         """Move to next step or end demo."""
@@ -6,7 +6,7 @@ import numpy as np
 import pandas as pd
 from scipy.spatial import cKDTree  # PHASE 3: For spatial deviation queries
 from scipy.interpolate import interp1d
-from app.color_config import color_config
+from app.color_config import get_color_config
 from app.dataset_manager import DatasetManager
 
 
@@ -41,6 +41,7 @@ class WorldModel:
 
     def __init__(self, data_dir: str, dataset_manager: DatasetManager = None):
         self.trajectories = {}  # car_id -> np.ndarray(N, 11) = [x, y, speed, lapdist, brake_front, brake_rear, gear, steering_deg, heading_rad, accel_norm, lap]
+        self.trajectories_version = 0  # Bumped whenever trajectories/bounds are (re)loaded or cleared
 
         # Multi-dataset support
         self.dataset_manager = dataset_manager
@@ -147,7 +148,7 @@ class WorldModel:
     def get_theme(self):
         """Get the current theme color dictionary."""
         # Use ColorConfig for customizable themes
-        return color_config.get_theme(self.current_theme)
+        return get_color_config().get_theme(self.current_theme)
 
     def toggle_theme(self):
         """Toggle between dark and light themes."""
@@ -212,6 +213,8 @@ class WorldModel:
             # Compute lap start indices
             self._compute_lap_data(car_id)
 
+        self.trajectories_version += 1
+
         # Load racing line
         racing_line_path = os.path.join(self.data_dir, 'racing_line.npy')
         self.racing_line = np.load(racing_line_path)
@@ -315,6 +318,7 @@ class WorldModel:
     def _clear_state(self):
         """Clear all loaded data before reloading."""
         self.trajectories.clear()
+        self.trajectories_version += 1
         self.per_car_racing_lines.clear()
         self.lap_lengths.clear()
         self.racing_line_trees.clear()
@@ -0,0 +1,63 @@
+"""Tests for ColorConfig persistence."""
+
+import json
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from app.color_config import ColorConfig
+
+
+def test_save_load_roundtrip(tmp_path):
+    """Saved colors and sizes are restored by a new ColorConfig."""
+    path = str(tmp_path / 'colors.json')
+    config = ColorConfig(path)
+    config.set_car_color(3, (1, 2, 3))
+    config.set_track_color('outline', (10, 20, 30, 40))
+    config.set_size('trail_width', 5)
+    config.save()
+
+    with open(path) as f:
+        saved = json.load(f)
+    assert saved['car_colors']['3'] == [1, 2, 3]
+
+    loaded = ColorConfig(path)
+    assert loaded.get_car_color(3) == (1, 2, 3)
+    assert loaded.get_track_colors()['outline'] == (10, 20, 30, 40)
+    assert loaded.get_size('trail_width') == 5
+    # Untouched entries keep their defaults
+    assert loaded.get_car_color(0) == ColorConfig(str(tmp_path / 'none.json')).get_car_color(0)
+
+
+def test_reset_category_restores_defaults(tmp_path):
+    """reset_category drops edits in that category only."""
+    config = ColorConfig(str(tmp_path / 'colors.json'))
+    default_light = config.get_brake_gradient()['front_light']
+    config.set_brake_color('front_light', (9, 9, 9))
+    config.set_car_color(0, (7, 7, 7))
+
+    config.reset_category('brake_gradient')
+    assert config.get_brake_gradient()['front_light'] == default_light
+    assert config.get_car_color(0) == (7, 7, 7)
+
+
+def test_malformed_entries_are_skipped(tmp_path):
+    """A bad saved entry keeps its default without discarding the rest."""
+    path = str(tmp_path / 'colors.json')
+    with open(path, 'w') as f:
+        json.dump({
+            'car_colors': {'0': 5, '1': [1, 2, 3], '2': [1, 2], '3': [300, 0, 0]},
+            'track': 'not a dict',
+            'sizes': {'car_dot_radius': 11, 'trail_width': [1, 2, 3]},
+        }, f)
+
+    defaults = ColorConfig(str(tmp_path / 'none.json'))
+    config = ColorConfig(path)
+    assert config.get_car_color(1) == (1, 2, 3)
+    assert config.get_size('car_dot_radius') == 11
+    for index in (0, 2, 3):
+        assert config.get_car_color(index) == defaults.get_car_color(index)
+    assert config.get_track_colors() == defaults.get_track_colors()
+    assert config.get_size('trail_width') == defaults.get_size('trail_width')
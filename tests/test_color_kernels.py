@@ -0,0 +1,40 @@
+"""Tests for the vectorized color gradient helpers."""
+
+import os
+import sys
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from app.color_kernels import interp_gradient_u8
+
+STOPS = np.array([(0, 0, 255), (0, 200, 0), (255, 0, 0)], dtype=np.uint8)
+
+
+def test_interp_gradient_hits_stops():
+    """Values 0, 0.5 and 1 map exactly to the three stops."""
+    colors = interp_gradient_u8(np.array([0.0, 0.5, 1.0]), STOPS)
+    assert colors.dtype == np.uint8
+    assert colors.shape == (3, 3)
+    np.testing.assert_array_equal(colors, STOPS)
+
+
+def test_interp_gradient_matches_scalar_lerp():
+    """Each value is interpolated within its half of the gradient."""
+    values = np.linspace(0.0, 1.0, 37)
+    colors = interp_gradient_u8(values, STOPS)
+    stops = STOPS.astype(np.float64)
+    for value, color in zip(values, colors):
+        if value > 0.5:
+            start, end, t = stops[1], stops[2], (value - 0.5) * 2.0
+        else:
+            start, end, t = stops[0], stops[1], value * 2.0
+        np.testing.assert_array_equal(color, (start + (end - start) * t).astype(np.uint8))
+
+
+def test_interp_gradient_clamps_out_of_range():
+    """Values outside 0-1 take the end stop colors."""
+    colors = interp_gradient_u8(np.array([-3.0, 4.0]), STOPS)
+    np.testing.assert_array_equal(colors, STOPS[[0, 2]])
@@ -0,0 +1,36 @@
+"""Tests for the color picker's hex conversions."""
+
+import os
+import sys
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+pytest.importorskip("dearpygui.dearpygui")
+
+from app.color_picker import ColorPicker
+
+
+@pytest.mark.parametrize("hex_str, expected", [
+    ("#ff4444", (255, 68, 68)),
+    ("00BFFF", (0, 191, 255)),
+    ("#f80", (255, 136, 0)),
+    ("#000000", (0, 0, 0)),
+])
+def test_hex_to_color_valid(hex_str, expected):
+    """Six- and three-digit hex strings parse with or without '#'."""
+    assert ColorPicker()._hex_to_color(hex_str) == expected
+
+
+@pytest.mark.parametrize("hex_str", ["", "#12345", "#1234567", "#gg0000", "0x1234", "#12_345"])
+def test_hex_to_color_invalid(hex_str):
+    """Malformed hex strings are rejected instead of raising."""
+    assert ColorPicker()._hex_to_color(hex_str) is None
+
+
+def test_color_to_hex_clamps():
+    """Out-of-range components are clamped before formatting."""
+    assert ColorPicker._color_to_hex((255, 68, 68)) == "#ff4444"
+    assert ColorPicker._color_to_hex((300, -5, 16)) == "#ff0010"
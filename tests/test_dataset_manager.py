@@ -0,0 +1,74 @@
+"""Tests for DatasetManager bookkeeping."""
+
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from app.dataset_manager import DatasetManager
+
+SAMPLE_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'sample')
+
+
+def test_comparison_data_is_cached_until_datasets_change():
+    """get_comparison_data is reused until a dataset is added, removed or activated."""
+    manager = DatasetManager()
+    assert manager.get_comparison_data() == {}
+
+    first_id, _ = manager.add_dataset(SAMPLE_DIR)
+    comparison = manager.get_comparison_data()
+    assert comparison['dataset_count'] == 1
+    assert manager.get_comparison_data() is comparison
+
+    second_id, _ = manager.add_dataset(SAMPLE_DIR)
+    comparison = manager.get_comparison_data()
+    assert comparison['dataset_count'] == 2
+    assert [d['is_active'] for d in comparison['datasets']] == [True, False]
+
+    manager.set_active_dataset(second_id)
+    comparison = manager.get_comparison_data()
+    assert [d['is_active'] for d in comparison['datasets']] == [False, True]
+
+    manager.remove_dataset(first_id)
+    comparison = manager.get_comparison_data()
+    assert comparison['dataset_count'] == 1
+    assert comparison['datasets'][0]['id'] == second_id
+
+
+def test_failed_changes_keep_cached_comparison():
+    """Unknown ids and refused removals don't drop the cache."""
+    manager = DatasetManager()
+    only_id, _ = manager.add_dataset(SAMPLE_DIR)
+    comparison = manager.get_comparison_data()
+
+    assert not manager.set_active_dataset('missing')
+    assert not manager.remove_dataset('missing')
+    assert not manager.remove_dataset(only_id)  # last dataset can't be removed
+    assert manager.get_comparison_data() is comparison
+
+
+def test_generation_bumps_on_every_change():
+    """generation changes on add/remove/activate and stays put otherwise."""
+    manager = DatasetManager()
+    generation = manager.generation
+
+    first_id, _ = manager.add_dataset(SAMPLE_DIR)
+    assert manager.generation > generation
+    generation = manager.generation
+
+    second_id, _ = manager.add_dataset(SAMPLE_DIR)
+    assert manager.generation > generation
+    generation = manager.generation
+
+    manager.get_comparison_data()
+    manager.get_dataset_list()
+    assert not manager.set_active_dataset('missing')
+    assert manager.generation == generation
+
+    manager.set_active_dataset(second_id)
+    assert manager.generation > generation
+    generation = manager.generation
+
+    manager.remove_dataset(first_id)
+    assert manager.generation > generation
@@ -0,0 +1,45 @@
+"""Tests for density map binning."""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+pytest.importorskip("dearpygui.dearpygui")
+
+from app.density_map import _uniform_histogram2d
+
+
+def _reference(x, y, bins, hist_range):
+    """np.histogram2d in screen orientation (row 0 = largest y)."""
+    histogram, _, _ = np.histogram2d(x, y, bins=bins, range=hist_range)
+    return np.flipud(histogram.T)
+
+
+@pytest.mark.parametrize("bins", [1, 7, 64])
+def test_matches_histogram2d(bins):
+    """Counts match np.histogram2d, transposed and flipped for the screen."""
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-500.0, 480.0, 20_000)
+    y = rng.normal(0.0, 150.0, 20_000)
+    hist_range = ((-500.0, 480.0), (-390.0, 390.0))
+
+    result = _uniform_histogram2d(x, y, bins, hist_range)
+    assert result.shape == (bins, bins)
+    assert result.dtype == np.float64
+    np.testing.assert_array_equal(result, _reference(x, y, bins, hist_range))
+
+
+def test_range_edges():
+    """Points on the upper edge land in the last bin; points outside are dropped."""
+    x = np.array([0.0, 10.0, 10.0, -0.1, 10.1, 5.0])
+    y = np.array([0.0, 10.0, 0.0, 5.0, 5.0, 11.0])
+    hist_range = ((0.0, 10.0), (0.0, 10.0))
+
+    result = _uniform_histogram2d(x, y, 4, hist_range)
+    assert result.sum() == 3
+    np.testing.assert_array_equal(result, _reference(x, y, 4, hist_range))
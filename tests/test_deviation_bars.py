@@ -0,0 +1,39 @@
+"""Tests for deviation bar fill levels."""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+pytest.importorskip("dearpygui.dearpygui")
+
+from app.deviation_bars import compute_bar_fills
+
+
+def test_fills_left_and_right():
+    """Negative scores fill the left bars, positive scores the right ones."""
+    assert compute_bar_fills(-0.5) == pytest.approx([1, 1, 0.5, 0, 0, 0, 0, 0, 0, 0])
+    assert compute_bar_fills(0.5) == pytest.approx([0, 0, 0, 0, 0, 1, 1, 0.5, 0, 0])
+    assert compute_bar_fills(0.0) == pytest.approx([0.0] * 10)
+
+
+def test_fills_clamp_score():
+    """Scores beyond +/-1 fill every bar on that side."""
+    assert compute_bar_fills(-7.0) == pytest.approx([1] * 5 + [0] * 5)
+    assert compute_bar_fills(3.0) == pytest.approx([0] * 5 + [1] * 5)
+
+
+def test_fills_into_out_array():
+    """With out=, fills are written in place and stale values are cleared."""
+    out = np.full(10, 9.0)
+    result = compute_bar_fills(0.3, out=out)
+    assert result is out
+    np.testing.assert_allclose(out, compute_bar_fills(0.3))
+
+    compute_bar_fills(-0.9, out=out)
+    np.testing.assert_allclose(out, compute_bar_fills(-0.9))
+    assert not out[5:].any()